@@ -98,6 +98,14 @@ class HookManager:
         elif policy.event_type == EventType.POST_TOOL_CALL:
             self.register_post_tool_call(policy.as_mcp_post_hook())
 
+    def has_pre_tool_call_hooks(self) -> bool:
+        """True if any pre-tool call hook is registered (lets callers skip the await)."""
+        return bool(self.pre_tool_call_hooks)
+
+    def has_post_tool_call_hooks(self) -> bool:
+        """True if any post-tool call hook is registered (lets callers skip the await)."""
+        return bool(self.post_tool_call_hooks)
+
     async def execute_pre_tool_call(
         self, tool_name: str, arguments: dict[str, Any]
     ) -> dict[str, Any]:
@@ -18,6 +18,11 @@ class TruncationPolicy(HookPolicy):
         if event.tool_name == "read_file":
             return PolicyResult(modified_data=event.output)
 
+        # batch_execute returns a JSON document whose entries were already
+        # truncated per call; cutting its middle would break the JSON
+        if event.tool_name == "batch_execute":
+            return PolicyResult(modified_data=event.output)
+
         # Use middle truncation for general tool outputs
         modified = truncate_output(
             event.output, 
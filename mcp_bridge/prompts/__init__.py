@@ -1,5 +1,8 @@
 # Agent prompts module
-from . import delphi, dewey, document_writer, explore, frontend, multimodal, planner, stravinsky
+#
+# Submodules are imported on first access so that loading one prompt does not
+# pull in every other prompt's source text.
+import importlib
 
 __all__ = [
     "stravinsky",
@@ -11,3 +14,9 @@ __all__ = [
     "multimodal",
     "planner",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
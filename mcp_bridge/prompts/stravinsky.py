@@ -94,7 +94,9 @@ Then: Raise your concern concisely. Propose an alternative. Ask if they want to
 I notice [observation]. This might cause [problem] because [reason].
 Alternative: [your suggestion].
 Should I proceed with your original request, or try the alternative?
-```"""
+```
+
+---"""
 
 
 STRAVINSKY_PHASE1 = """## Phase 1 - Codebase Assessment (for Open-ended tasks)
@@ -118,7 +120,9 @@ Before following existing patterns, assess whether they're worth following.
 IMPORTANT: If codebase appears undisciplined, verify before assuming:
 - Different patterns may serve different purposes (intentional)
 - Migration might be in progress
-- You might be looking at the wrong reference files"""
+- You might be looking at the wrong reference files
+
+---"""
 
 
 STRAVINSKY_PARALLEL_EXECUTION = """### Parallel Execution (DEFAULT behavior)
@@ -154,7 +158,9 @@ STOP searching when:
 - 2 search iterations yielded no new useful data
 - Direct answer found
 
-**DO NOT over-explore. Time is precious.**"""
+**DO NOT over-explore. Time is precious.**
+
+---"""
 
 
 STRAVINSKY_PHASE2B_PRE_IMPLEMENTATION = """## ⚠️ CRITICAL: PARALLEL-FUWT WORKFLOW
@@ -338,7 +344,9 @@ If project has build/test commands, run them at task completion.
 | Test run | Pass (or explicit note of pre-existing failures) |
 | Delegation | Agent result received and verified via `agent_output` |
 
-**NO EVIDENCE = NOT COMPLETE.**"""
+**NO EVIDENCE = NOT COMPLETE.**
+
+---"""
 
 
 STRAVINSKY_PHASE2C = """## Phase 2C - Failure Recovery
@@ -357,7 +365,9 @@ STRAVINSKY_PHASE2C = """## Phase 2C - Failure Recovery
 4. **CONSULT** Delphi with full failure context via `agent_spawn(agent_type="delphi", ...)`
 5. If Delphi cannot resolve -> **ASK USER** before proceeding
 
-**Never**: Leave code in broken state, continue hoping it'll work, delete failing tests to "pass" """
+**Never**: Leave code in broken state, continue hoping it'll work, delete failing tests to "pass" 
+
+---"""
 
 
 STRAVINSKY_PHASE3 = """## Phase 3 - Completion
@@ -671,6 +681,8 @@ def get_stravinsky_prompt() -> str:
     Returns:
         The full system prompt for the Stravinsky agent.
     """
+    # Phase separators ("---") are baked into the end of the section constants
+    # that close a phase, so only content entries are joined here.
     sections = [
         STRAVINSKY_ROLE_SECTION,
         "<Behavior_Instructions>",
@@ -681,12 +693,8 @@ def get_stravinsky_prompt() -> str:
         "",
         STRAVINSKY_PHASE0_STEP1_3,
         "",
-        "---",
-        "",
         STRAVINSKY_PHASE1,
         "",
-        "---",
-        "",
         "## Phase 2A - Exploration & Research",
         "",
         STRAVINSKY_TOOL_SELECTION,
@@ -697,8 +705,6 @@ def get_stravinsky_prompt() -> str:
         "",
         STRAVINSKY_PARALLEL_EXECUTION,
         "",
-        "---",
-        "",
         STRAVINSKY_PHASE2B_PRE_IMPLEMENTATION,
         "",
         STRAVINSKY_FRONTEND_SECTION,
@@ -711,12 +717,8 @@ def get_stravinsky_prompt() -> str:
         "",
         STRAVINSKY_CODE_CHANGES,
         "",
-        "---",
-        "",
         STRAVINSKY_PHASE2C,
         "",
-        "---",
-        "",
         STRAVINSKY_PHASE3,
         "",
         "</Behavior_Instructions>",
@@ -8,15 +8,20 @@ Optimized for extremely fast startup and protocol compliance:
 """
 
 import asyncio
+import contextlib
+import importlib
 import logging
 import os
 import sys
 import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
+    CallToolResult,
     GetPromptResult,
     Prompt,
     PromptMessage,
@@ -50,7 +55,7 @@ try:
     stravinsky_env = Path.home() / ".stravinsky" / ".env"
     if stravinsky_env.exists():
         load_dotenv(stravinsky_env, override=True)
-        logger.info(f"[Config] Loaded environment from {stravinsky_env}")
+        logger.info("[Config] Loaded environment from %s", stravinsky_env)
 except ImportError:
     pass  # python-dotenv not installed, skip
 
@@ -74,7 +79,10 @@ def install_emergency_logger():
     sys.excepthook = handle_exception
 
 
-install_emergency_logger()
+# MCP hosts run the server with stdin on a pipe. Interactive CLI use keeps the
+# default excepthook, which already prints the traceback to the terminal.
+if os.environ.get("STRAVINSKY_DEBUG") == "1" or sys.stdin is None or not sys.stdin.isatty():
+    install_emergency_logger()
 
 # --- SERVER INITIALIZATION ---
 
@@ -83,6 +91,7 @@ server = Server("stravinsky", version=__version__)
 # Lazy-loaded systems
 _token_store = None
 _hook_manager = None
+_prompt_results: dict[str, GetPromptResult] = {}
 
 
 def get_token_store():
@@ -103,704 +112,770 @@ def get_hook_manager_lazy():
     return _hook_manager
 
 
-# --- MCP INTERFACE ---
-
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools (metadata only)."""
-    from .server_tools import get_tool_definitions
-
-    return get_tool_definitions()
-
-
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls with deep lazy loading of implementations."""
-    hook_manager = get_hook_manager_lazy()
-    token_store = get_token_store()
-
-    try:
-        # Pre-tool call hooks orchestration
-        arguments = await hook_manager.execute_pre_tool_call(name, arguments)
-
-        result_content = None
-
-        # --- MODEL DISPATCH ---
-        if name == "invoke_gemini":
-            from .tools.model_invoke import invoke_gemini
-
-            result_content = await invoke_gemini(
-                token_store=token_store,
-                prompt=arguments["prompt"],
-                model=arguments.get("model", "gemini-3-flash"),
-                temperature=arguments.get("temperature", 0.7),
-                max_tokens=arguments.get("max_tokens", 8192),
-                thinking_budget=arguments.get("thinking_budget", 0),
-            )
-
-        elif name == "invoke_gemini_agentic":
-            from .tools.model_invoke import invoke_gemini_agentic
-
-            result_content = await invoke_gemini_agentic(
-                token_store=token_store,
-                prompt=arguments["prompt"],
-                model=arguments.get("model", "gemini-3-flash"),
-                max_turns=arguments.get("max_turns", 10),
-                timeout=arguments.get("timeout", 120),
-            )
-
-        elif name == "invoke_openai":
-            from .tools.model_invoke import invoke_openai
-
-            result_content = await invoke_openai(
-                token_store=token_store,
-                prompt=arguments["prompt"],
-                model=arguments.get("model", "gpt-5.2-codex"),
-                temperature=arguments.get("temperature", 0.7),
-                max_tokens=arguments.get("max_tokens", 4096),
-                thinking_budget=arguments.get("thinking_budget", 0),
-                reasoning_effort=arguments.get("reasoning_effort", "medium"),
-            )
-
-        # --- CONTEXT DISPATCH ---
-        elif name == "get_project_context":
-            from .tools.project_context import get_project_context
-
-            result_content = await get_project_context(project_path=arguments.get("project_path"))
-
-        elif name == "get_system_health":
-            from .tools.project_context import get_system_health
-
-            result_content = await get_system_health()
-
-        elif name == "semantic_health":
-            from .tools.semantic_search import semantic_health
-
-            result_content = await semantic_health(
-                project_path=arguments.get("project_path", "."),
-                provider=arguments.get("provider", "ollama"),
-            )
-
-        elif name == "lsp_health":
-            from .tools.lsp.tools import lsp_health
-
-            result_content = await lsp_health()
-
-        # --- SEARCH DISPATCH ---
-        elif name == "grep_search":
-            from .tools.code_search import grep_search
-
-            result_content = await grep_search(
-                pattern=arguments["pattern"],
-                directory=arguments.get("directory", "."),
-                file_pattern=arguments.get("file_pattern", ""),
-            )
-
-        elif name == "list_directory":
-            from .tools.list_directory import list_directory
-
-            result_content = await list_directory(
-                path=arguments["path"],
-            )
-
-        elif name == "ast_grep_search":
-            from .tools.code_search import ast_grep_search
-
-            result_content = await ast_grep_search(
-                pattern=arguments["pattern"],
-                directory=arguments.get("directory", "."),
-                language=arguments.get("language", ""),
-            )
-
-        elif name == "ast_grep_replace":
-            from .tools.code_search import ast_grep_replace
-
-            result_content = await ast_grep_replace(
-                pattern=arguments["pattern"],
-                replacement=arguments["replacement"],
-                directory=arguments.get("directory", "."),
-                language=arguments.get("language", ""),
-                dry_run=arguments.get("dry_run", True),
-            )
-
-        elif name == "glob_files":
-            from .tools.code_search import glob_files
-
-            result_content = await glob_files(
-                pattern=arguments["pattern"],
-                directory=arguments.get("directory", "."),
-            )
-
-        elif name == "read_file":
-            from .tools.read_file import read_file
-
-            result_content = await read_file(
-                path=arguments["path"],
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit"),
-            )
-
-        elif name == "write_file":
-            from .tools.write_file import write_file
-
-            result_content = await write_file(
-                path=arguments["path"],
-                content=arguments["content"],
-            )
-
-        elif name == "replace":
-            from .tools.replace import replace
-
-            result_content = await replace(
-                path=arguments["path"],
-                old_string=arguments["old_string"],
-                new_string=arguments["new_string"],
-                instruction=arguments["instruction"],
-                expected_replacements=arguments.get("expected_replacements", 1),
-            )
-
-        elif name == "run_shell_command":
-            from .tools.run_shell_command import run_shell_command
-
-            result_content = await run_shell_command(
-                command=arguments["command"],
-                description=arguments["description"],
-                dir_path=arguments.get("dir_path", "."),
-            )
-
-        elif name == "tool_search":
-            from .tools.tool_search import search_tools
-            from .server_tools import get_tool_definitions
-
-            # Get all registered tool definitions to search through
-            all_tools = get_tool_definitions()
-
-            result_content = search_tools(
-                query=arguments["query"],
-                tools=all_tools,
-                top_k=arguments.get("top_k", 5),
-            )
-
-        # --- SESSION DISPATCH ---
-        elif name == "session_list":
-            from .tools.session_manager import list_sessions
-
-            result_content = list_sessions(
-                project_path=arguments.get("project_path"),
-                limit=arguments.get("limit", 20),
-            )
-
-        elif name == "session_read":
-            from .tools.session_manager import read_session
-
-            result_content = read_session(
-                session_id=arguments["session_id"],
-                limit=arguments.get("limit"),
-            )
-
-        elif name == "session_search":
-            from .tools.session_manager import search_sessions
-
-            result_content = search_sessions(
-                query=arguments["query"],
-                session_id=arguments.get("session_id"),
-                limit=arguments.get("limit", 20),
-            )
-
-        # --- SKILL DISPATCH ---
-        elif name == "skill_list":
-            from .tools.skill_loader import list_skills
-
-            result_content = list_skills(project_path=arguments.get("project_path"))
-
-        elif name == "skill_get":
-            from .tools.skill_loader import get_skill
-
-            result_content = get_skill(
-                name=arguments["name"],
-                project_path=arguments.get("project_path"),
-            )
-
-        elif name == "stravinsky_version":
-            # sys and os already imported at module level
-            result_content = [
-                TextContent(
-                    type="text",
-                    text=f"Stravinsky Bridge v{__version__}\n"
-                    f"Python: {sys.version.split()[0]}\n"
-                    f"Platform: {sys.platform}\n"
-                    f"CWD: {os.getcwd()}\n"
-                    f"CLI: {os.environ.get('CLAUDE_CLI', '/opt/homebrew/bin/claude')}",
-                )
-            ]
-
-        elif name == "system_restart":
-            # Schedule a restart. We can't exit immediately or MCP will error on the reply.
-            # We'll use a small delay.
-            async def restart_soon():
-                await asyncio.sleep(1)
-                os._exit(0)  # Immediate exit
-
-            asyncio.create_task(restart_soon())
-            result_content = [
-                TextContent(
-                    type="text",
-                    text="🚀 Restarting Stravinsky Bridge... This process will exit and Claude Code will automatically respawn it. Please wait a few seconds before calling tools again.",
-                )
-            ]
-
-        # --- AGENT DISPATCH ---
-        elif name == "agent_spawn":
-            from .tools.agent_manager import agent_spawn
-
-            result_content = await agent_spawn(**arguments)
-
-        elif name == "agent_output":
-            from .tools.agent_manager import agent_output
-
-            result_content = await agent_output(
-                task_id=arguments["task_id"],
-                block=arguments.get("block", False),
-            )
-
-        elif name == "agent_cancel":
-            from .tools.agent_manager import agent_cancel
-
-            result_content = await agent_cancel(task_id=arguments["task_id"])
-
-        elif name == "agent_list":
-            from .tools.agent_manager import agent_list
-
-            result_content = await agent_list(show_all=arguments.get("show_all", True))
-
-        elif name == "agent_cleanup":
-            from .tools.agent_manager import agent_cleanup
-
-            result_content = await agent_cleanup(
-                max_age_minutes=arguments.get("max_age_minutes", 30),
-                statuses=arguments.get("statuses"),
-            )
-
-        elif name == "agent_progress":
-            from .tools.agent_manager import agent_progress
-
-            result_content = await agent_progress(
-                task_id=arguments["task_id"],
-                lines=arguments.get("lines", 20),
-            )
-
-        elif name == "agent_retry":
-            from .tools.agent_manager import agent_retry
-
-            result_content = await agent_retry(
-                task_id=arguments["task_id"],
-                new_prompt=arguments.get("new_prompt"),
-                new_timeout=arguments.get("new_timeout"),
-            )
-
-        # --- BACKGROUND TASK DISPATCH ---
-        elif name == "task_spawn":
-            from .tools.background_tasks import task_spawn
-
-            result_content = await task_spawn(
-                prompt=arguments["prompt"],
-                model=arguments.get("model", "gemini-3-flash"),
-            )
-
-        elif name == "task_status":
-            from .tools.background_tasks import task_status
-
-            result_content = await task_status(task_id=arguments["task_id"])
-
-        elif name == "task_list":
-            from .tools.background_tasks import task_list
-
-            result_content = await task_list()
-
-        # --- LSP DISPATCH ---
-        elif name == "lsp_hover":
-            from .tools.lsp import lsp_hover
-
-            result_content = await lsp_hover(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-            )
-
-        elif name == "lsp_goto_definition":
-            from .tools.lsp import lsp_goto_definition
-
-            result_content = await lsp_goto_definition(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-            )
-
-        elif name == "lsp_find_references":
-            from .tools.lsp import lsp_find_references
-
-            result_content = await lsp_find_references(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-                include_declaration=arguments.get("include_declaration", True),
-            )
-
-        elif name == "lsp_document_symbols":
-            from .tools.lsp import lsp_document_symbols
-
-            result_content = await lsp_document_symbols(file_path=arguments["file_path"])
-
-        elif name == "lsp_workspace_symbols":
-            from .tools.lsp import lsp_workspace_symbols
-
-            result_content = await lsp_workspace_symbols(query=arguments["query"])
+# --- TOOL DISPATCH ---
+
+# Tool name -> async handler taking the raw MCP arguments dict.
+# Each handler lazy-loads its implementation on first use.
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]] = {}
+
+
+def _tool(name: str):
+    """Register a handler in the call_tool dispatch table."""
+
+    def register(fn):
+        _TOOL_HANDLERS[name] = fn
+        return fn
+
+    return register
+
+
+# Defaults shared by several bindings below. Must match the tool schemas.
+_DEF_GEMINI_MODEL = "gemini-3-flash"
+_DEF_OPENAI_MODEL = "gpt-5.2-codex"
+_DEF_TEMPERATURE = 0.7
+
+
+@dataclass(frozen=True)
+class _ToolBinding:
+    """A tool whose handler only forwards MCP arguments to one implementation function."""
+
+    module: str
+    function: str
+    required: tuple[str, ...] = ()
+    optional: dict[str, Any] = field(default_factory=dict)
+    is_async: bool = True
+    token_store: bool = False
+
+
+_TOOL_BINDINGS: dict[str, _ToolBinding] = {
+    # --- MODEL DISPATCH ---
+    "invoke_gemini": _ToolBinding(
+        ".tools.model_invoke",
+        "invoke_gemini",
+        required=("prompt",),
+        optional={
+            "model": _DEF_GEMINI_MODEL,
+            "temperature": _DEF_TEMPERATURE,
+            "max_tokens": 8192,
+            "thinking_budget": 0,
+        },
+        token_store=True,
+    ),
+    "invoke_gemini_agentic": _ToolBinding(
+        ".tools.model_invoke",
+        "invoke_gemini_agentic",
+        required=("prompt",),
+        optional={"model": _DEF_GEMINI_MODEL, "max_turns": 10, "timeout": 120},
+        token_store=True,
+    ),
+    "invoke_openai": _ToolBinding(
+        ".tools.model_invoke",
+        "invoke_openai",
+        required=("prompt",),
+        optional={
+            "model": _DEF_OPENAI_MODEL,
+            "temperature": _DEF_TEMPERATURE,
+            "max_tokens": 4096,
+            "thinking_budget": 0,
+            "reasoning_effort": "medium",
+        },
+        token_store=True,
+    ),
+
+    # --- CONTEXT DISPATCH ---
+    "get_project_context": _ToolBinding(
+        ".tools.project_context",
+        "get_project_context",
+        optional={"project_path": None},
+    ),
+    "get_system_health": _ToolBinding(".tools.project_context", "get_system_health"),
+    "semantic_health": _ToolBinding(
+        ".tools.semantic_search",
+        "semantic_health",
+        optional={"project_path": ".", "provider": "ollama"},
+    ),
+    "lsp_health": _ToolBinding(".tools.lsp.tools", "lsp_health"),
+
+    # --- SEARCH DISPATCH ---
+    "grep_search": _ToolBinding(
+        ".tools.code_search",
+        "grep_search",
+        required=("pattern",),
+        optional={"directory": ".", "file_pattern": ""},
+    ),
+    "list_directory": _ToolBinding(".tools.list_directory", "list_directory", required=("path",)),
+    "ast_grep_search": _ToolBinding(
+        ".tools.code_search",
+        "ast_grep_search",
+        required=("pattern",),
+        optional={"directory": ".", "language": ""},
+    ),
+    "ast_grep_replace": _ToolBinding(
+        ".tools.code_search",
+        "ast_grep_replace",
+        required=("pattern", "replacement"),
+        optional={"directory": ".", "language": "", "dry_run": True},
+    ),
+    "glob_files": _ToolBinding(
+        ".tools.code_search",
+        "glob_files",
+        required=("pattern",),
+        optional={"directory": "."},
+    ),
+    "read_file": _ToolBinding(
+        ".tools.read_file",
+        "read_file",
+        required=("path",),
+        optional={"offset": 0, "limit": None},
+    ),
+    "write_file": _ToolBinding(".tools.write_file", "write_file", required=("path", "content")),
+    "replace": _ToolBinding(
+        ".tools.replace",
+        "replace",
+        required=("path", "old_string", "new_string", "instruction"),
+        optional={"expected_replacements": 1},
+    ),
+    "run_shell_command": _ToolBinding(
+        ".tools.run_shell_command",
+        "run_shell_command",
+        required=("command", "description"),
+        optional={"dir_path": "."},
+    ),
+
+    # --- SESSION DISPATCH ---
+    "session_list": _ToolBinding(
+        ".tools.session_manager",
+        "list_sessions",
+        optional={"project_path": None, "limit": 20},
+        is_async=False,
+    ),
+    "session_read": _ToolBinding(
+        ".tools.session_manager",
+        "read_session",
+        required=("session_id",),
+        optional={"limit": None},
+        is_async=False,
+    ),
+    "session_search": _ToolBinding(
+        ".tools.session_manager",
+        "search_sessions",
+        required=("query",),
+        optional={"session_id": None, "limit": 20},
+        is_async=False,
+    ),
+
+    # --- SKILL DISPATCH ---
+    "skill_list": _ToolBinding(
+        ".tools.skill_loader",
+        "list_skills",
+        optional={"project_path": None},
+        is_async=False,
+    ),
+    "skill_get": _ToolBinding(
+        ".tools.skill_loader",
+        "get_skill",
+        required=("name",),
+        optional={"project_path": None},
+        is_async=False,
+    ),
+
+    # --- AGENT DISPATCH ---
+    "agent_output": _ToolBinding(
+        ".tools.agent_manager",
+        "agent_output",
+        required=("task_id",),
+        optional={"block": False},
+    ),
+    "agent_cancel": _ToolBinding(".tools.agent_manager", "agent_cancel", required=("task_id",)),
+    "agent_list": _ToolBinding(".tools.agent_manager", "agent_list", optional={"show_all": True}),
+    "agent_cleanup": _ToolBinding(
+        ".tools.agent_manager",
+        "agent_cleanup",
+        optional={"max_age_minutes": 30, "statuses": None},
+    ),
+    "agent_progress": _ToolBinding(
+        ".tools.agent_manager",
+        "agent_progress",
+        required=("task_id",),
+        optional={"lines": 20},
+    ),
+    "agent_retry": _ToolBinding(
+        ".tools.agent_manager",
+        "agent_retry",
+        required=("task_id",),
+        optional={"new_prompt": None, "new_timeout": None},
+    ),
+
+    # --- BACKGROUND TASK DISPATCH ---
+    "task_spawn": _ToolBinding(
+        ".tools.background_tasks",
+        "task_spawn",
+        required=("prompt",),
+        optional={"model": _DEF_GEMINI_MODEL},
+    ),
+    "task_status": _ToolBinding(".tools.background_tasks", "task_status", required=("task_id",)),
+    "task_list": _ToolBinding(".tools.background_tasks", "task_list"),
+
+    # --- LSP DISPATCH ---
+    "lsp_hover": _ToolBinding(
+        ".tools.lsp",
+        "lsp_hover",
+        required=("file_path", "line", "character"),
+    ),
+    "lsp_goto_definition": _ToolBinding(
+        ".tools.lsp",
+        "lsp_goto_definition",
+        required=("file_path", "line", "character"),
+    ),
+    "lsp_find_references": _ToolBinding(
+        ".tools.lsp",
+        "lsp_find_references",
+        required=("file_path", "line", "character"),
+        optional={"include_declaration": True},
+    ),
+    "lsp_document_symbols": _ToolBinding(
+        ".tools.lsp",
+        "lsp_document_symbols",
+        required=("file_path",),
+    ),
+    "lsp_workspace_symbols": _ToolBinding(
+        ".tools.lsp",
+        "lsp_workspace_symbols",
+        required=("query",),
+    ),
+    "lsp_prepare_rename": _ToolBinding(
+        ".tools.lsp",
+        "lsp_prepare_rename",
+        required=("file_path", "line", "character"),
+    ),
+    "lsp_rename": _ToolBinding(
+        ".tools.lsp",
+        "lsp_rename",
+        required=("file_path", "line", "character", "new_name"),
+    ),
+    "lsp_code_actions": _ToolBinding(
+        ".tools.lsp",
+        "lsp_code_actions",
+        required=("file_path", "line", "character"),
+    ),
+    "lsp_code_action_resolve": _ToolBinding(
+        ".tools.lsp",
+        "lsp_code_action_resolve",
+        required=("file_path", "action_code"),
+        optional={"line": None},
+    ),
+    "lsp_extract_refactor": _ToolBinding(
+        ".tools.lsp",
+        "lsp_extract_refactor",
+        required=("file_path", "start_line", "start_char", "end_line", "end_char", "new_name"),
+        optional={"kind": "function"},
+    ),
+    "lsp_servers": _ToolBinding(".tools.lsp", "lsp_servers"),
+    "lsp_diagnostics": _ToolBinding(
+        ".tools.code_search",
+        "lsp_diagnostics",
+        required=("file_path",),
+        optional={"severity": "all"},
+    ),
+    "semantic_search": _ToolBinding(
+        ".tools.semantic_search",
+        "semantic_search",
+        required=("query",),
+        optional={
+            "project_path": ".",
+            "n_results": 10,
+            "language": None,
+            "node_type": None,
+            "provider": "ollama",
+        },
+    ),
+    "hybrid_search": _ToolBinding(
+        ".tools.semantic_search",
+        "hybrid_search",
+        required=("query",),
+        optional={
+            "pattern": None,
+            "project_path": ".",
+            "n_results": 10,
+            "language": None,
+            "provider": "ollama",
+        },
+    ),
+    "find_code": _ToolBinding(
+        ".tools.find_code",
+        "find_code",
+        required=("query",),
+        optional={
+            "search_type": "auto",
+            "project_path": ".",
+            "language": None,
+            "n_results": 10,
+            "provider": "ollama",
+        },
+    ),
+    "multi_query_search": _ToolBinding(
+        ".tools.search_enhancements",
+        "multi_query_search",
+        required=("query",),
+        optional={
+            "project_path": ".",
+            "n_results": 10,
+            "num_expansions": 3,
+            "language": None,
+            "node_type": None,
+            "provider": "ollama",
+        },
+    ),
+    "decomposed_search": _ToolBinding(
+        ".tools.search_enhancements",
+        "decomposed_search",
+        required=("query",),
+        optional={
+            "project_path": ".",
+            "n_results": 10,
+            "language": None,
+            "node_type": None,
+            "provider": "ollama",
+        },
+    ),
+    "enhanced_search": _ToolBinding(
+        ".tools.search_enhancements",
+        "enhanced_search",
+        required=("query",),
+        optional={
+            "project_path": ".",
+            "n_results": 10,
+            "mode": "auto",
+            "language": None,
+            "node_type": None,
+            "provider": "ollama",
+        },
+    ),
+    "get_cost_report": _ToolBinding(
+        ".tools.dashboard",
+        "get_cost_report",
+        optional={"session_id": None},
+    ),
+    "semantic_index": _ToolBinding(
+        ".tools.semantic_search",
+        "index_codebase",
+        optional={"project_path": ".", "force": False, "provider": "ollama"},
+    ),
+    "semantic_stats": _ToolBinding(
+        ".tools.semantic_search",
+        "semantic_stats",
+        optional={"project_path": ".", "provider": "ollama"},
+    ),
+    "cancel_indexing": _ToolBinding(
+        ".tools.semantic_search",
+        "cancel_indexing",
+        optional={"project_path": ".", "provider": "ollama"},
+        is_async=False,
+    ),
+    "delete_index": _ToolBinding(
+        ".tools.semantic_search",
+        "delete_index",
+        optional={"project_path": ".", "provider": None, "delete_all": False},
+        is_async=False,
+    ),
+}
+
+
+def _generate_handler(
+    name: str, binding: _ToolBinding
+) -> Callable[[dict[str, Any]], Awaitable[Any]]:
+    """
+    Compile a specialized handler for a plain argument-forwarding tool.
 
-        elif name == "lsp_prepare_rename":
-            from .tools.lsp import lsp_prepare_rename
+    The implementation is imported here, once, and bound into the handler's
+    globals. Required arguments become direct ``arguments[...]`` lookups and
+    defaults are inlined as literals, so the generated code matches what would
+    be written by hand without the per-tool boilerplate.
+    """
+    module = importlib.import_module(binding.module, __package__)
+    kwargs = ["token_store=get_token_store()"] if binding.token_store else []
+    kwargs += [f"{arg}=_{arg}" for arg in binding.required]
+    kwargs += [
+        f"{arg}=arguments.get({arg!r}, {default!r})" for arg, default in binding.optional.items()
+    ]
+    call = f"_impl({', '.join(kwargs)})"
+    source = f"async def _tool_{name}(arguments):\n"
+    if binding.required:
+        # _handle_call_tool validates arguments against the schema first, but
+        # call_tool() is also reached without it (in-process callers), and pre-tool
+        # hooks may rewrite arguments after validation: keep a readable error.
+        source += "    try:\n"
+        source += "".join(f"        _{arg} = arguments[{arg!r}]\n" for arg in binding.required)
+        source += (
+            "    except KeyError as e:\n"
+            f"        raise ValueError(f'{name}: missing required argument {{e}}') from None\n"
+        )
+    source += f"    return {'await ' if binding.is_async else ''}{call}\n"
+    namespace = {
+        "__name__": __name__,
+        "_impl": getattr(module, binding.function),
+        "get_token_store": get_token_store,
+    }
+    exec(compile(source, f"<stravinsky tool {name}>", "exec"), namespace)
+    return namespace[f"_tool_{name}"]
 
-            result_content = await lsp_prepare_rename(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-            )
 
-        elif name == "lsp_rename":
-            from .tools.lsp import lsp_rename
+def _get_tool_handler(name: str) -> Callable[[dict[str, Any]], Awaitable[Any]] | None:
+    """
+    Return the handler for a tool, compiling forwarding handlers on first use.
 
-            result_content = await lsp_rename(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-                new_name=arguments["new_name"],
-            )
+    Resolved handlers are cached in _TOOL_HANDLERS, so later calls are a single
+    dict lookup with no import machinery involved.
+    """
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None and name in _TOOL_BINDINGS:
+        handler = _TOOL_HANDLERS[name] = _generate_handler(name, _TOOL_BINDINGS[name])
+    return handler
 
-        elif name == "lsp_code_actions":
-            from .tools.lsp import lsp_code_actions
 
-            result_content = await lsp_code_actions(
-                file_path=arguments["file_path"],
-                line=arguments["line"],
-                character=arguments["character"],
-            )
+# Tools that need more than argument forwarding keep hand-written handlers.
 
-        elif name == "lsp_code_action_resolve":
-            from .tools.lsp import lsp_code_action_resolve
 
-            result_content = await lsp_code_action_resolve(
-                file_path=arguments["file_path"],
-                action_code=arguments["action_code"],
-                line=arguments.get("line"),
-            )
+@_tool("tool_search")
+async def _tool_tool_search(arguments: dict[str, Any]) -> Any:
+    from .tools.tool_search import search_tools
+    from .server_tools import get_tool_definitions
 
-        elif name == "lsp_extract_refactor":
-            from .tools.lsp import lsp_extract_refactor
-
-            result_content = await lsp_extract_refactor(
-                file_path=arguments["file_path"],
-                start_line=arguments["start_line"],
-                start_char=arguments["start_char"],
-                end_line=arguments["end_line"],
-                end_char=arguments["end_char"],
-                new_name=arguments["new_name"],
-                kind=arguments.get("kind", "function"),
-            )
+    # Get all registered tool definitions to search through
+    all_tools = get_tool_definitions()
 
-        elif name == "lsp_servers":
-            from .tools.lsp import lsp_servers
+    return search_tools(
+        query=arguments["query"],
+        tools=all_tools,
+        top_k=arguments.get("top_k", 5),
+    )
 
-            result_content = await lsp_servers()
 
-        elif name == "lsp_diagnostics":
-            from .tools.code_search import lsp_diagnostics
+@_tool("batch_execute")
+async def _tool_batch_execute(arguments: dict[str, Any]) -> Any:
+    from .server_tools import validate_tool_arguments
+    from .utils.json_codec import dumps
 
-            result_content = await lsp_diagnostics(
-                file_path=arguments["file_path"],
-                severity=arguments.get("severity", "all"),
-            )
+    calls = arguments["calls"]
+    stop_on_error = arguments.get("stop_on_error", False)
+    semaphore = asyncio.Semaphore(max(1, arguments.get("max_concurrent", 8)))
+    hook_manager = get_hook_manager_lazy()
 
-        elif name == "semantic_search":
-            from .tools.semantic_search import semantic_search
+    async def run(call: dict[str, Any]) -> str:
+        name = call.get("name")
+        if name == "batch_execute":
+            raise ValueError("batch_execute cannot be nested")
+        handler = _get_tool_handler(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        call_args = call.get("arguments") or {}
+        error = validate_tool_arguments(name, call_args)
+        if error is not None:
+            raise ValueError(f"Input validation error: {error}")
+        async with semaphore:
+            if hook_manager.has_pre_tool_call_hooks():
+                call_args = await hook_manager.execute_pre_tool_call(name, call_args)
+            result = await handler(call_args)
+        if isinstance(result, list):
+            text = "\n".join(getattr(item, "text", str(item)) for item in result)
+        else:
+            text = str(result)
+        # Post hooks (e.g. truncation) see each call under its own tool name.
+        if text and hook_manager.has_post_tool_call_hooks():
+            text = await hook_manager.execute_post_tool_call(name, call_args, text) or text
+        return text
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    if tasks:
+        if stop_on_error:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        else:
+            await asyncio.wait(tasks)
+
+    results = []
+    for call, task in zip(calls, tasks, strict=True):
+        entry: dict[str, Any] = {"name": call.get("name")}
+        if task.cancelled():
+            entry.update(ok=False, error="Cancelled after an earlier failure")
+        elif task.exception() is not None:
+            exc = task.exception()
+            entry.update(ok=False, error=_format_tool_error(exc))
+        else:
+            entry.update(ok=True, result=task.result())
+        results.append(entry)
+
+    return dumps(results, indent=True)
+
+
+@_tool("stravinsky_version")
+async def _tool_stravinsky_version(arguments: dict[str, Any]) -> Any:
+    # sys and os already imported at module level
+    return [
+        TextContent(
+            type="text",
+            text=f"Stravinsky Bridge v{__version__}\n"
+            f"Python: {sys.version.split()[0]}\n"
+            f"Platform: {sys.platform}\n"
+            f"CWD: {os.getcwd()}\n"
+            f"CLI: {os.environ.get('CLAUDE_CLI', '/opt/homebrew/bin/claude')}",
+        )
+    ]
+
+
+@_tool("system_restart")
+async def _tool_system_restart(arguments: dict[str, Any]) -> Any:
+    # Schedule a restart. We can't exit immediately or MCP will error on the reply,
+    # so exit once this request's reply has been flushed to stdout.
+    replied = None
+    # LookupError: called outside a client request, so there is no reply to wait for
+    if _stdout_writer is not None:
+        with contextlib.suppress(LookupError):
+            replied = _stdout_writer.response_flushed(server.request_context.request_id)
+
+    async def restart_soon():
+        if replied is None:
+            await asyncio.sleep(0.05)
+        else:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(replied.wait(), timeout=1)
+        # os._exit skips atexit, so write out agent state still waiting on the
+        # debounced writer. Skip it if no agent manager was ever created.
+        agent_manager = sys.modules.get("mcp_bridge.tools.agent_manager")
+        if agent_manager is not None and agent_manager._manager is not None:
+            agent_manager._manager.flush_tasks()
+        os._exit(0)  # Immediate exit
 
-            result_content = await semantic_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
+    asyncio.create_task(restart_soon())
+    return [
+        TextContent(
+            type="text",
+            text="🚀 Restarting Stravinsky Bridge... This process will exit and Claude Code will automatically respawn it. Please wait a few seconds before calling tools again.",
+        )
+    ]
 
-        elif name == "hybrid_search":
-            from .tools.semantic_search import hybrid_search
 
-            result_content = await hybrid_search(
-                query=arguments["query"],
-                pattern=arguments.get("pattern"),
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                language=arguments.get("language"),
-                provider=arguments.get("provider", "ollama"),
-            )
+@_tool("agent_spawn")
+async def _tool_agent_spawn(arguments: dict[str, Any]) -> Any:
+    from .tools.agent_manager import agent_spawn
 
-        elif name == "find_code":
-            from .tools.find_code import find_code
+    return await agent_spawn(**arguments)
 
-            result_content = await find_code(
-                query=arguments["query"],
-                search_type=arguments.get("search_type", "auto"),
-                project_path=arguments.get("project_path", "."),
-                language=arguments.get("language"),
-                n_results=arguments.get("n_results", 10),
-                provider=arguments.get("provider", "ollama"),
-            )
 
-        elif name == "multi_query_search":
-            from .tools.search_enhancements import multi_query_search
-
-            result_content = await multi_query_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                num_expansions=arguments.get("num_expansions", 3),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
+@_tool("start_file_watcher")
+async def _tool_start_file_watcher(arguments: dict[str, Any]) -> Any:
+    from .tools.semantic_search import start_file_watcher
+    from .utils.json_codec import dumps
 
-        elif name == "decomposed_search":
-            from .tools.search_enhancements import decomposed_search
+    try:
+        watcher = await start_file_watcher(
+            project_path=arguments.get("project_path", "."),
+            provider=arguments.get("provider", "ollama"),
+            debounce_seconds=arguments.get("debounce_seconds", 2.0),
+        )
+
+        return dumps(
+            {
+                "status": "started",
+                "project_path": str(watcher.project_path),
+                "debounce_seconds": watcher.debounce_seconds,
+                "provider": watcher.store.provider_name,
+                "is_running": watcher.is_running(),
+            },
+            indent=True,
+        )
+    except ValueError as e:
+        # No index exists
+        print(f"⚠️  start_file_watcher ValueError: {e}", file=sys.stderr)
+        return dumps(
+            {"error": str(e), "hint": "Run semantic_index() before starting file watcher"},
+            indent=True,
+        )
+    except Exception as e:
+        # Unexpected error
+        import traceback
 
-            result_content = await decomposed_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
+        print(f"❌ start_file_watcher error: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return dumps(
+            {
+                "error": f"{type(e).__name__}: {str(e)}",
+                "hint": "Check MCP server logs for details",
+            },
+            indent=True,
+        )
 
-        elif name == "enhanced_search":
-            from .tools.search_enhancements import enhanced_search
-
-            result_content = await enhanced_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                mode=arguments.get("mode", "auto"),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
 
-        elif name == "get_cost_report":
-            from .tools.dashboard import get_cost_report
+@_tool("stop_file_watcher")
+async def _tool_stop_file_watcher(arguments: dict[str, Any]) -> Any:
+    from .tools.semantic_search import stop_file_watcher
+    from .utils.json_codec import dumps
 
-            result_content = await get_cost_report(
-                session_id=arguments.get("session_id"),
-            )
+    stopped = stop_file_watcher(
+        project_path=arguments.get("project_path", "."),
+    )
 
-        elif name == "semantic_index":
-            from .tools.semantic_search import index_codebase
+    return dumps(
+        {"stopped": stopped, "project_path": arguments.get("project_path", ".")}, indent=True
+    )
 
-            result_content = await index_codebase(
-                project_path=arguments.get("project_path", "."),
-                force=arguments.get("force", False),
-                provider=arguments.get("provider", "ollama"),
-            )
 
-        elif name == "semantic_stats":
-            from .tools.semantic_search import semantic_stats
+@_tool("list_file_watchers")
+async def _tool_list_file_watchers(arguments: dict[str, Any]) -> Any:
+    from .tools.semantic_search import list_file_watchers
+    from .utils.json_codec import dumps
 
-            result_content = await semantic_stats(
-                project_path=arguments.get("project_path", "."),
-                provider=arguments.get("provider", "ollama"),
-            )
+    return dumps(list_file_watchers(), indent=True)
 
-        elif name == "start_file_watcher":
-            import json
 
-            from .tools.semantic_search import start_file_watcher
+# --- MCP INTERFACE ---
 
-            try:
-                watcher = await start_file_watcher(
-                    project_path=arguments.get("project_path", "."),
-                    provider=arguments.get("provider", "ollama"),
-                    debounce_seconds=arguments.get("debounce_seconds", 2.0),
-                )
-
-                result_content = json.dumps(
-                    {
-                        "status": "started",
-                        "project_path": str(watcher.project_path),
-                        "debounce_seconds": watcher.debounce_seconds,
-                        "provider": watcher.store.provider_name,
-                        "is_running": watcher.is_running(),
-                    },
-                    indent=2,
-                )
-            except ValueError as e:
-                # No index exists
-                result_content = json.dumps(
-                    {"error": str(e), "hint": "Run semantic_index() before starting file watcher"},
-                    indent=2,
-                )
-                print(f"⚠️  start_file_watcher ValueError: {e}", file=sys.stderr)
-            except Exception as e:
-                # Unexpected error
-                import traceback
 
-                result_content = json.dumps(
-                    {
-                        "error": f"{type(e).__name__}: {str(e)}",
-                        "hint": "Check MCP server logs for details",
-                    },
-                    indent=2,
-                )
-                print(f"❌ start_file_watcher error: {e}", file=sys.stderr)
-                traceback.print_exc(file=sys.stderr)
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools (metadata only, built once per process)."""
+    from .server_tools import get_tool_definitions
 
-        elif name == "stop_file_watcher":
-            import json
+    return get_tool_definitions()
 
-            from .tools.semantic_search import stop_file_watcher
 
-            stopped = stop_file_watcher(
-                project_path=arguments.get("project_path", "."),
-            )
+# Longest error summary sent back to the client for a failed tool call.
+_MAX_ERROR_CHARS = 512
 
-            result_content = json.dumps(
-                {"stopped": stopped, "project_path": arguments.get("project_path", ".")}, indent=2
-            )
 
-        elif name == "cancel_indexing":
-            from .tools.semantic_search import cancel_indexing
+def _format_tool_error(exc: BaseException) -> str:
+    """Summarize a tool failure as one short line for the client."""
+    from pydantic import ValidationError
 
-            result_content = cancel_indexing(
-                project_path=arguments.get("project_path", "."),
-                provider=arguments.get("provider", "ollama"),
-            )
+    if isinstance(exc, ValidationError):
+        # str() of a ValidationError lists every error with its input value.
+        first = exc.errors()[0] if exc.error_count() else {}
+        loc = ".".join(str(part) for part in first.get("loc", ()))
+        message = (
+            f"{exc.error_count()} validation error(s) for {exc.title}: "
+            f"{loc}: {first.get('msg', '')}"
+        )
+    else:
+        message = str(exc)
+    text = f"{type(exc).__name__}: {message}"
+    if len(text) > _MAX_ERROR_CHARS:
+        text = text[: _MAX_ERROR_CHARS - 3] + "..."
+    return text
 
-        elif name == "delete_index":
-            from .tools.semantic_search import delete_index
 
-            result_content = delete_index(
-                project_path=arguments.get("project_path", "."),
-                provider=arguments.get("provider"),  # None if not specified
-                delete_all=arguments.get("delete_all", False),
-            )
+def _normalize_result(result: Any) -> list[TextContent]:
+    """Shape a tool handler's return value as the list[TextContent] MCP expects."""
+    if isinstance(result, list) and (not result or isinstance(result[0], TextContent)):
+        return result
+    if isinstance(result, (dict, list)):
+        # Structured results go out as JSON rather than their Python repr.
+        from .utils.json_codec import dumps
 
-        elif name == "list_file_watchers":
-            import json
+        return [TextContent(type="text", text=dumps(result))]
+    return [TextContent(type="text", text=str(result))]
 
-            from .tools.semantic_search import list_file_watchers
 
-            result_content = json.dumps(list_file_watchers(), indent=2)
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls with deep lazy loading of implementations."""
+    hook_manager = _hook_manager or get_hook_manager_lazy()
+    # Arguments can carry multi-KB prompts: only format them when DEBUG is on.
+    logger.debug("Tool call: %s args=%.200s", name, arguments)
 
-        elif name == "multi_query_search":
-            from .tools.semantic_search import multi_query_search
+    try:
+        # Pre-tool call hooks orchestration
+        if hook_manager.has_pre_tool_call_hooks():
+            arguments = await hook_manager.execute_pre_tool_call(name, arguments)
 
-            result_content = await multi_query_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                num_expansions=arguments.get("num_expansions", 3),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
+        handler = _get_tool_handler(name)
+        if handler is None:
+            result_content = f"Unknown tool: {name}"
+        else:
+            result_content = await handler(arguments)
 
-        elif name == "decomposed_search":
-            from .tools.semantic_search import decomposed_search
+        result_content = _normalize_result(result_content)
 
-            result_content = await decomposed_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
+        # Post-tool call hooks orchestration
+        if result_content and hook_manager.has_post_tool_call_hooks():
+            processed_text = await hook_manager.execute_post_tool_call(
+                name, arguments, result_content[0].text
             )
+            # Only update if processed_text is non-empty to avoid empty text blocks
+            # (API error: cache_control cannot be set for empty text blocks)
+            if processed_text:
+                result_content[0].text = processed_text
 
-        elif name == "enhanced_search":
-            from .tools.semantic_search import enhanced_search
-
-            result_content = await enhanced_search(
-                query=arguments["query"],
-                project_path=arguments.get("project_path", "."),
-                n_results=arguments.get("n_results", 10),
-                mode=arguments.get("mode", "auto"),
-                language=arguments.get("language"),
-                node_type=arguments.get("node_type"),
-                provider=arguments.get("provider", "ollama"),
-            )
+        return result_content
 
-        else:
-            result_content = f"Unknown tool: {name}"
+    except Exception as e:
+        # Full traceback stays in the server log; the client gets a short summary.
+        logger.exception("Error calling tool %s", name)
+        return [TextContent(type="text", text=f"Error: {_format_tool_error(e)}")]
 
-        # Post-tool call hooks orchestration
-        if result_content is not None:
-            if (
-                isinstance(result_content, list)
-                and len(result_content) > 0
-                and hasattr(result_content[0], "text")
-            ):
-                processed_text = await hook_manager.execute_post_tool_call(
-                    name, arguments, result_content[0].text
-                )
-                # Only update if processed_text is non-empty to avoid empty text blocks
-                # (API error: cache_control cannot be set for empty text blocks)
-                if processed_text:
-                    result_content[0].text = processed_text
-            elif isinstance(result_content, str):
-                result_content = await hook_manager.execute_post_tool_call(
-                    name, arguments, result_content
-                )
-
-        # Format final return as List[TextContent]
-        if isinstance(result_content, list):
-            return result_content
-        return [TextContent(type="text", text=str(result_content))]
 
-    except Exception as e:
-        import traceback
+# The SDK's own input validation recompiles the schema with jsonschema.validate
+# on every call; validate_tool_arguments keeps one compiled validator per tool.
+@server.call_tool(validate_input=False)
+async def _handle_call_tool(
+    name: str, arguments: dict[str, Any]
+) -> list[TextContent] | CallToolResult:
+    """Validate client arguments against the tool's inputSchema, then dispatch."""
+    from .server_tools import validate_tool_arguments
 
-        tb = traceback.format_exc()
-        logger.error(f"Error calling tool {name}: {e}\n{tb}")
-        return [TextContent(type="text", text=f"Error: {str(e)}\n\nTraceback:\n{tb}")]
+    error = validate_tool_arguments(name, arguments)
+    if error is not None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Input validation error: {error}")],
+            isError=True,
+        )
+    return await call_tool(name, arguments)
 
 
 @server.list_prompts()
-async def list_prompts() -> list[Prompt]:
-    """List available prompts (metadata only)."""
+async def list_prompts() -> Sequence[Prompt]:
+    """List available prompts (metadata only, built once per process)."""
     from .server_tools import get_prompt_definitions
 
     return get_prompt_definitions()
 
 
+# Prompt name -> (description, module, builder function).
+_PROMPTS: dict[str, tuple[str, str, str]] = {
+    "stravinsky": (
+        "Stravinsky orchestrator system prompt",
+        ".prompts.stravinsky",
+        "get_stravinsky_prompt",
+    ),
+    "delphi": ("Delphi advisor system prompt", ".prompts.delphi", "get_delphi_prompt"),
+    "dewey": ("Dewey research agent prompt", ".prompts.dewey", "get_dewey_prompt"),
+    "explore": ("Explore codebase search prompt", ".prompts.explore", "get_explore_prompt"),
+    "frontend": ("Frontend UI/UX Engineer prompt", ".prompts.frontend", "get_frontend_prompt"),
+    "document_writer": (
+        "Document Writer prompt",
+        ".prompts.document_writer",
+        "get_document_writer_prompt",
+    ),
+    "multimodal": ("Multimodal Looker prompt", ".prompts.multimodal", "get_multimodal_prompt"),
+}
+
+
 @server.get_prompt()
 async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
-    """Get a specific prompt content (lazy loaded)."""
-    from .prompts import delphi, dewey, document_writer, explore, frontend, multimodal, stravinsky
-
-    prompts_map = {
-        "stravinsky": ("Stravinsky orchestrator system prompt", stravinsky.get_stravinsky_prompt),
-        "delphi": ("Delphi advisor system prompt", delphi.get_delphi_prompt),
-        "dewey": ("Dewey research agent prompt", dewey.get_dewey_prompt),
-        "explore": ("Explore codebase search prompt", explore.get_explore_prompt),
-        "frontend": ("Frontend UI/UX Engineer prompt", frontend.get_frontend_prompt),
-        "document_writer": ("Document Writer prompt", document_writer.get_document_writer_prompt),
-        "multimodal": ("Multimodal Looker prompt", multimodal.get_multimodal_prompt),
-    }
+    """Get a specific prompt content (lazy loaded, built once per process)."""
+    result = _prompt_results.get(name)
+    if result is not None:
+        return result
 
-    if name not in prompts_map:
+    if name not in _PROMPTS:
         raise ValueError(f"Unknown prompt: {name}")
 
-    description, get_prompt_fn = prompts_map[name]
+    # Only the requested prompt module is imported.
+    description, module, function = _PROMPTS[name]
+    get_prompt_fn = getattr(importlib.import_module(module, __package__), function)
     prompt_text = get_prompt_fn()
 
-    return GetPromptResult(
+    result = _prompt_results[name] = GetPromptResult(
         description=description,
         messages=[
             PromptMessage(
@@ -809,6 +884,7 @@ async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptRe
             )
         ],
     )
+    return result
 
 
 def sync_user_assets():
@@ -862,7 +938,7 @@ def sync_user_assets():
             pass
 
     if package_claude is None:
-        logger.debug(f"Package assets not found (checked: {dev_claude}, {installed_claude})")
+        logger.debug("Package assets not found (checked: %s, %s)", dev_claude, installed_claude)
         return
 
     # Directories to sync
@@ -897,18 +973,120 @@ def sync_user_assets():
 
                 if should_copy:
                     shutil.copy2(src_file, dst_file)
-                    logger.debug(f"Synced {dir_name}/{rel_path} to user scope")
+                    logger.debug("Synced %s/%s to user scope", dir_name, rel_path)
 
     logger.info("Synced package assets to user scope (~/.claude/)")
 
 
+# Tool modules most calls go through. Importing them in the background at
+# startup keeps their import time off the first tool call's response.
+_WARMUP_MODULES = (
+    ".tools.model_invoke",
+    ".tools.code_search",
+    ".tools.agent_manager",
+    ".tools.lsp",
+)
+
+
+async def _warmup_tool_modules() -> None:
+    """Import the hot tool modules in worker threads (STRAVINSKY_WARMUP=0 disables)."""
+    if os.getenv("STRAVINSKY_WARMUP", "1").lower() in {"0", "false"}:
+        return
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(importlib.import_module, module, __package__)
+            for module in _WARMUP_MODULES
+        ),
+        return_exceptions=True,
+    )
+    for module, result in zip(_WARMUP_MODULES, results, strict=True):
+        if isinstance(result, Exception):
+            logger.debug("Warmup import of %s failed: %s", module, result)
+
+
+# Set by async_main(); the event loop only holds a weak reference to tasks.
+_warmup_task: asyncio.Task | None = None
+
+
+def _log_warmup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Tool module warmup failed", exc_info=task.exception())
+
+
+# JSON-RPC frames carrying prompts or file contents are often tens of KiB.
+_STDIO_BUFFER_SIZE = 1 << 16
+
+
+class _FlushSignalingWriter:
+    """Async stdout wrapper that reports when the response to a request is flushed."""
+
+    def __init__(self, file):
+        self._file = file
+        self._awaited: dict[Any, asyncio.Event] = {}
+        self._written: list[asyncio.Event] = []
+
+    def response_flushed(self, request_id: Any) -> asyncio.Event:
+        """Return an event set once the response to request_id has been flushed."""
+        event = self._awaited[request_id] = asyncio.Event()
+        return event
+
+    async def write(self, data: str) -> int:
+        # stdio_server writes one JSON-RPC message per call. Only decode it while
+        # someone is waiting, and skip server requests/notifications ("method").
+        if self._awaited:
+            from .utils.json_codec import loads
+
+            try:
+                message = loads(data)
+            except ValueError:
+                message = None
+            if isinstance(message, dict) and "method" not in message:
+                event = self._awaited.pop(message.get("id"), None)
+                if event is not None:
+                    self._written.append(event)
+        return await self._file.write(data)
+
+    async def flush(self) -> None:
+        await self._file.flush()
+        written, self._written = self._written, []
+        for event in written:
+            event.set()
+
+
+# Set by _buffered_stdio(); lets system_restart wait for its reply to be sent.
+_stdout_writer: _FlushSignalingWriter | None = None
+
+
+def _buffered_stdio():
+    """
+    Wrap the stdio file descriptors for stdio_server with 64 KiB buffers.
+
+    The default 8 KiB buffers split large frames into several read syscalls.
+    stdio_server flushes after every message, so output is never held back.
+    """
+    global _stdout_writer
+    import anyio
+
+    # The wrappers live for the whole process (closefd=False), so no context manager.
+    stdin = open(  # noqa: SIM115
+        sys.stdin.fileno(), encoding="utf-8", buffering=_STDIO_BUFFER_SIZE, closefd=False
+    )
+    stdout = open(  # noqa: SIM115
+        sys.stdout.fileno(), "w", encoding="utf-8", buffering=_STDIO_BUFFER_SIZE, closefd=False
+    )
+    _stdout_writer = _FlushSignalingWriter(anyio.wrap_file(stdout))
+    return anyio.wrap_file(stdin), _stdout_writer
+
+
 async def async_main():
     """Server execution entry point."""
+    global _warmup_task
+
     # Sync package assets to user scope on every MCP load
     try:
         sync_user_assets()
     except Exception as e:
-        logger.warning(f"Failed to sync user assets: {e}")
+        logger.warning("Failed to sync user assets: %s", e)
 
     # Initialize hooks at runtime, not import time
     try:
@@ -916,7 +1094,10 @@ async def async_main():
 
         initialize_hooks()
     except Exception as e:
-        logger.error(f"Failed to initialize hooks: {e}")
+        logger.error("Failed to initialize hooks: %s", e)
+
+    _warmup_task = asyncio.create_task(_warmup_tool_modules())
+    _warmup_task.add_done_callback(_log_warmup_failure)
 
     # Clean up stale ChromaDB locks on startup
     try:
@@ -924,9 +1105,9 @@ async def async_main():
 
         removed_count = cleanup_stale_chromadb_locks()
         if removed_count > 0:
-            logger.info(f"Cleaned up {removed_count} stale ChromaDB lock(s)")
+            logger.info("Cleaned up %s stale ChromaDB lock(s)", removed_count)
     except Exception as e:
-        logger.warning(f"Failed to cleanup ChromaDB locks: {e}")
+        logger.warning("Failed to cleanup ChromaDB locks: %s", e)
 
     # Start background token refresh scheduler
     try:
@@ -935,10 +1116,10 @@ async def async_main():
         asyncio.create_task(background_token_refresh(get_token_store()))
         logger.info("Background token refresh scheduler started")
     except Exception as e:
-        logger.warning(f"Failed to start token refresh scheduler: {e}")
+        logger.warning("Failed to start token refresh scheduler: %s", e)
 
     try:
-        async with stdio_server() as (read_stream, write_stream):
+        async with stdio_server(*_buffered_stdio()) as (read_stream, write_stream):
             await server.run(
                 read_stream,
                 write_stream,
@@ -955,12 +1136,35 @@ async def async_main():
         await lsp_manager.shutdown()
 
 
+def _run_server() -> None:
+    """Run async_main, on a uvloop event loop when uvloop is installed.
+
+    uvloop is an optional speed-up (``pip install stravinsky[perf]``) and is not
+    available on Windows, where the default asyncio loop is used. Set
+    STRAVINSKY_UVLOOP=0 to use the default loop even when uvloop is installed.
+    """
+    uvloop = None
+    if os.getenv("STRAVINSKY_UVLOOP", "1").lower() not in {"0", "false"}:
+        with contextlib.suppress(ImportError):
+            import uvloop
+
+    if uvloop is None:
+        asyncio.run(async_main())
+        return
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(async_main())
+
+
 def main():
     """Synchronous entry point with CLI arg handling."""
-    import argparse
+    # MCP hosts spawn the server with no arguments. Start it straight away
+    # rather than importing argparse and building the CLI parser first.
+    if sys.argv[1:] in ([], ["start"]):
+        _run_server()
+        return 0
 
-    from .auth.token_store import TokenStore
-    from .tools.agent_manager import get_manager
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="Stravinsky MCP Bridge - Multi-model AI orchestration for Claude Code. "
@@ -1077,6 +1281,8 @@ def main():
     args, unknown = parser.parse_known_args()
 
     if args.command == "list":
+        from .tools.agent_manager import get_manager
+
         # Run agent_list logic
         manager = get_manager()
         tasks = manager.list_tasks()
@@ -1106,23 +1312,25 @@ def main():
     elif args.command == "status":
         from .auth.cli import cmd_status
 
-        return cmd_status(TokenStore())
+        return cmd_status(get_token_store())
 
     elif args.command == "start":
-        asyncio.run(async_main())
+        _run_server()
         return 0
 
     elif args.command == "stop":
+        from .tools.agent_manager import get_manager
+
         manager = get_manager()
-        count = manager.stop_all(clear_history=getattr(args, "clear", False))
-        if getattr(args, "clear", False):
+        count = manager.stop_all(clear_history=args.clear)
+        if args.clear:
             print(f"Cleared {count} agent task(s) from history.")
         else:
             print(f"Stopped {count} running agent(s).")
         return 0
 
     elif args.command == "auth":
-        auth_cmd = getattr(args, "auth_command", None)
+        auth_cmd = args.auth_command
         token_store = get_token_store()
 
         if auth_cmd == "login":
@@ -1159,8 +1367,8 @@ def main():
         # Default behavior: start server (fallback for MCP runners and unknown args)
         # This ensures that flags like --transport stdio don't cause an exit
         if unknown:
-            logger.info(f"Starting MCP server with unknown arguments: {unknown}")
-        asyncio.run(async_main())
+            logger.info("Starting MCP server with unknown arguments: %s", unknown)
+        _run_server()
         return 0
 
 
@@ -1,28 +1,166 @@
+from typing import Any
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.types import Prompt, Tool
 
+# Schemas and property fragments shared by several tools below. Tool definitions
+# only ever read their inputSchema, so one object can be referenced from many
+# Tools.
+_PROP_FILE_PATH = {"type": "string", "description": "Absolute path to the file"}
+_PROP_PROJECT_PATH = {"type": "string", "description": "Path to the project root", "default": "."}
+_PROP_N_RESULTS = {
+    "type": "integer",
+    "description": "Maximum number of results to return",
+    "default": 10,
+}
+_PROP_EMBEDDING_PROVIDER = {
+    "type": "string",
+    "description": (
+        "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), "
+        "openai (cloud/OAuth), huggingface (cloud)"
+    ),
+    "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
+    "default": "ollama",
+}
+_PROP_AGENT_CONTEXT = {
+    "type": "object",
+    "description": "Optional agent metadata for logging (agent_type, task_id, description)",
+    "properties": {
+        "agent_type": {
+            "type": "string",
+            "description": "Type of agent (explore, delphi, frontend, etc.)",
+        },
+        "task_id": {
+            "type": "string",
+            "description": "Background task ID if running as agent",
+        },
+        "description": {
+            "type": "string",
+            "description": "Short description of what the agent is doing",
+        },
+    },
+}
+
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+_LSP_POSITION_PROPERTIES = {
+    "file_path": _PROP_FILE_PATH,
+    "line": {"type": "integer", "description": "Line number (1-indexed)"},
+    "character": {"type": "integer", "description": "Character position (0-indexed)"},
+}
+_LSP_POSITION_REQUIRED = ["file_path", "line", "character"]
+_LSP_POSITION_SCHEMA = {
+    "type": "object",
+    "properties": _LSP_POSITION_PROPERTIES,
+    "required": _LSP_POSITION_REQUIRED,
+}
+
+
+def _construct_tool(*, meta: dict[str, Any] | None = None, **fields: Any) -> Tool:
+    """
+    Tool.model_construct() that keeps ``meta`` as an extra field.
+
+    The validating Tool(meta=...) constructor stores it as an extra, which goes
+    out on the wire as "meta"; model_construct would fill the aliased field and
+    send "_meta" instead. Clients have always seen "meta", so keep it that way.
+    """
+    tool = Tool.model_construct(**fields)
+    if meta is not None:
+        tool.__pydantic_extra__["meta"] = meta
+    return tool
+
+
+def _lsp_position_tool(
+    name: str,
+    description: str,
+    extra_properties: dict | None = None,
+    extra_required: tuple[str, ...] = (),
+) -> Tool:
+    """Build an LSP tool that takes a file position, plus optional extra arguments."""
+    schema = _LSP_POSITION_SCHEMA
+    if extra_properties:
+        schema = {
+            "type": "object",
+            "properties": {**_LSP_POSITION_PROPERTIES, **extra_properties},
+            "required": [*_LSP_POSITION_REQUIRED, *extra_required],
+        }
+    return _construct_tool(
+        name=name,
+        description=description,
+        inputSchema=schema,
+        meta={"defer_loading": True},
+    )
+
+
+# The definitions are static, so each list is built once and shared by every
+# caller (list_tools, list_prompts, tool_search). Callers must not mutate them.
+_tools_cache: list[Tool] | None = None
+_tools_by_name: dict[str, Tool] | None = None
+_prompts_cache: tuple[Prompt, ...] | None = None
+
 
 def get_tool_definitions() -> list[Tool]:
-    """Return all Tool definitions for the Stravinsky MCP server."""
+    """Return all Tool definitions for the Stravinsky MCP server (built once)."""
+    global _tools_cache
+    if _tools_cache is None:
+        _tools_cache = _build_tool_definitions()
+    return _tools_cache
+
+
+def get_tool(name: str) -> Tool | None:
+    """Return the Tool definition called name, or None if there is none."""
+    global _tools_by_name
+    if _tools_by_name is None:
+        _tools_by_name = {tool.name: tool for tool in get_tool_definitions()}
+    return _tools_by_name.get(name)
+
+
+def get_prompt_definitions() -> tuple[Prompt, ...]:
+    """Return all Prompt definitions for the Stravinsky MCP server (built once)."""
+    global _prompts_cache
+    if _prompts_cache is None:
+        _prompts_cache = _build_prompt_definitions()
+    return _prompts_cache
+
+
+# Compiled argument validators, one per tool name, created on first call.
+_validators: dict[str, Any] = {}
+
+
+def validate_tool_arguments(name: str, arguments: dict[str, Any]) -> str | None:
+    """
+    Check tool-call arguments against the tool's inputSchema.
+
+    Returns the message of the most relevant violation, or None when the
+    arguments are valid or the tool is not in the catalog.
+    """
+    validator = _validators.get(name)
+    if validator is None:
+        tool = get_tool(name)
+        if tool is None:
+            return None
+        validator = validator_for(tool.inputSchema)(tool.inputSchema)
+        _validators[name] = validator
+    error = best_match(validator.iter_errors(arguments))
+    return None if error is None else error.message
+
+
+def _build_tool_definitions() -> list[Tool]:
     return [
-        Tool(
+        _construct_tool(
             name="stravinsky_version",
             description="Returns the current version of the Stravinsky MCP bridge and diagnostic info.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="system_restart",
             description="Force-restarts the Stravinsky MCP server by exiting the process. The host (Claude Code) will automatically respawn it, picking up any updated code/packages.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="tool_search",
             description="Search for tools by name, description, or category. Returns matching tools with their descriptions and parameters. Use this to discover available tools before using them.",
             inputSchema={
@@ -45,7 +183,43 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["query"],
             },
         ),
-        Tool(
+        _construct_tool(
+            name="batch_execute",
+            description=(
+                "Run several independent tool calls in one request. Calls execute concurrently "
+                "(bounded by max_concurrent) and results are returned together as JSON, in call order. "
+                "Use this instead of many sequential grep/lsp/read calls."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "calls": {
+                        "type": "array",
+                        "description": "Tool calls to run, e.g. [{\"name\": \"grep_search\", \"arguments\": {\"pattern\": \"TODO\"}}]",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "Tool name"},
+                                "arguments": {"type": "object", "description": "Tool arguments"},
+                            },
+                            "required": ["name"],
+                        },
+                    },
+                    "max_concurrent": {
+                        "type": "integer",
+                        "description": "Maximum number of calls running at once",
+                        "default": 8,
+                    },
+                    "stop_on_error": {
+                        "type": "boolean",
+                        "description": "Cancel remaining calls after the first failure",
+                        "default": False,
+                    },
+                },
+                "required": ["calls"],
+            },
+        ),
+        _construct_tool(
             name="list_directory",
             description="List files and directories in a path. Uses caching for faster repeated access.",
             inputSchema={
@@ -57,7 +231,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="read_file",
             description=(
                 "Read the contents of a file. Supports smart truncation and log-awareness. "
@@ -81,7 +255,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="write_file",
             description="Write content to a file. Invalidates related cache entries.",
             inputSchema={
@@ -94,7 +268,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="replace",
             description="Replace text in a file. Invalidates related cache entries.",
             inputSchema={
@@ -114,7 +288,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="run_shell_command",
             description="Execute a shell command. Invalidates cache if it looks like a write operation.",
             inputSchema={
@@ -128,7 +302,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="invoke_gemini",
             description=(
                 "Invoke a Gemini model with the given prompt. "
@@ -163,30 +337,13 @@ def get_tool_definitions() -> list[Tool]:
                         "description": "Tokens reserved for internal reasoning (if model supports it)",
                         "default": 0,
                     },
-                    "agent_context": {
-                        "type": "object",
-                        "description": "Optional agent metadata for logging (agent_type, task_id, description)",
-                        "properties": {
-                            "agent_type": {
-                                "type": "string",
-                                "description": "Type of agent (explore, delphi, frontend, etc.)",
-                            },
-                            "task_id": {
-                                "type": "string",
-                                "description": "Background task ID if running as agent",
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Short description of what the agent is doing",
-                            },
-                        },
-                    },
+                    "agent_context": _PROP_AGENT_CONTEXT,
                 },
                 "required": ["prompt"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="invoke_gemini_agentic",
             description=(
                 "Invoke Gemini with function calling for agentic tasks. "
@@ -216,29 +373,12 @@ def get_tool_definitions() -> list[Tool]:
                         "description": "Request timeout in seconds (default: 120)",
                         "default": 120,
                     },
-                    "agent_context": {
-                        "type": "object",
-                        "description": "Optional agent metadata for logging (agent_type, task_id, description)",
-                        "properties": {
-                            "agent_type": {
-                                "type": "string",
-                                "description": "Type of agent (explore, delphi, frontend, etc.)",
-                            },
-                            "task_id": {
-                                "type": "string",
-                                "description": "Background task ID if running as agent",
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Short description of what the agent is doing",
-                            },
-                        },
-                    },
+                    "agent_context": _PROP_AGENT_CONTEXT,
                 },
                 "required": ["prompt"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="invoke_openai",
             description=(
                 "Invoke an OpenAI model with the given prompt. "
@@ -279,30 +419,13 @@ def get_tool_definitions() -> list[Tool]:
                         "enum": ["low", "medium", "high"],
                         "default": "medium",
                     },
-                    "agent_context": {
-                        "type": "object",
-                        "description": "Optional agent metadata for logging (agent_type, task_id, description)",
-                        "properties": {
-                            "agent_type": {
-                                "type": "string",
-                                "description": "Type of agent (explore, delphi, frontend, etc.)",
-                            },
-                            "task_id": {
-                                "type": "string",
-                                "description": "Background task ID if running as agent",
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Short description of what the agent is doing",
-                            },
-                        },
-                    },
+                    "agent_context": _PROP_AGENT_CONTEXT,
                 },
                 "required": ["prompt"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="get_project_context",
             description="Summarize project environment including Git status, local rules (.claude/rules/), and pending todos.",
             inputSchema={
@@ -313,16 +436,13 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="get_system_health",
             description="Comprehensive check of system dependencies (rg, fd, sg, etc.) and authentication status.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="lsp_diagnostics",
             description="Get diagnostics (errors, warnings) for a file using language tools (tsc, ruff).",
             inputSchema={
@@ -339,7 +459,7 @@ def get_tool_definitions() -> list[Tool]:
             },
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="ast_grep_search",
             description="Search codebase using ast-grep for structural AST patterns.",
             inputSchema={
@@ -356,7 +476,7 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["pattern"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="grep_search",
             description="Fast text search using ripgrep.",
             inputSchema={
@@ -373,7 +493,7 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["pattern"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="glob_files",
             description="Find files matching a glob pattern.",
             inputSchema={
@@ -389,7 +509,7 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["pattern"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="session_list",
             description="List Claude Code sessions with optional filtering.",
             inputSchema={
@@ -401,7 +521,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="session_read",
             description="Read messages from a Claude Code session.",
             inputSchema={
@@ -414,7 +534,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="session_search",
             description="Search across Claude Code session messages.",
             inputSchema={
@@ -428,7 +548,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="skill_list",
             description="List available Claude Code skills/commands from .claude/commands/.",
             inputSchema={
@@ -439,7 +559,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="skill_get",
             description="Get the content of a specific skill/command.",
             inputSchema={
@@ -452,7 +572,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="task_spawn",
             description=(
                 "Spawn a background task to execute a prompt asynchronously. "
@@ -475,7 +595,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="task_status",
             description="Check the status and retrieve results of a background task.",
             inputSchema={
@@ -487,16 +607,13 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="task_list",
             description="List all active and recent background tasks.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="agent_spawn",
             description=(
                 "PREFERRED TOOL for parallel work. Spawn multiple agents simultaneously for independent tasks. "
@@ -544,7 +661,7 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["prompt"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="agent_retry",
             description="Retry a failed or timed-out background agent. Can optionally refine the prompt.",
             inputSchema={
@@ -564,7 +681,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="agent_output",
             description="Get output from a background agent. Use block=true to wait for completion.",
             inputSchema={
@@ -580,7 +697,7 @@ def get_tool_definitions() -> list[Tool]:
                 "required": ["task_id"],
             },
         ),
-        Tool(
+        _construct_tool(
             name="agent_cancel",
             description="Cancel a running background agent.",
             inputSchema={
@@ -592,7 +709,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="agent_list",
             description="List all background agent tasks with their status. By default shows all agents; use show_all=false to see only running/pending.",
             inputSchema={
@@ -607,7 +724,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="agent_cleanup",
             description="Clean up old completed/failed/cancelled agents to reduce clutter in agent_list. Removes agents older than max_age_minutes.",
             inputSchema={
@@ -627,7 +744,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="agent_progress",
             description="Get real-time progress from a running background agent. Shows recent output lines to monitor what the agent is doing.",
             inputSchema={
@@ -644,75 +761,38 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
-            name="lsp_hover",
-            description="Get type info, documentation, and signature at a position in a file.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
-                },
-                "required": ["file_path", "line", "character"],
-            },
-                    meta={"defer_loading": True},
-        ),
-        Tool(
-            name="lsp_goto_definition",
-            description="Find where a symbol is defined. Jump to symbol definition.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
-                },
-                "required": ["file_path", "line", "character"],
-            },
-                    meta={"defer_loading": True},
-        ),
-        Tool(
-            name="lsp_find_references",
-            description="Find all references to a symbol across the workspace.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
-                    "include_declaration": {
-                        "type": "boolean",
-                        "description": "Include the declaration itself",
-                        "default": True,
-                    },
+        _lsp_position_tool(
+            "lsp_hover",
+            "Get type info, documentation, and signature at a position in a file.",
+        ),
+        _lsp_position_tool(
+            "lsp_goto_definition",
+            "Find where a symbol is defined. Jump to symbol definition.",
+        ),
+        _lsp_position_tool(
+            "lsp_find_references",
+            "Find all references to a symbol across the workspace.",
+            {
+                "include_declaration": {
+                    "type": "boolean",
+                    "description": "Include the declaration itself",
+                    "default": True,
                 },
-                "required": ["file_path", "line", "character"],
             },
-                    meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="lsp_document_symbols",
             description="Get hierarchical outline of all symbols (functions, classes, methods) in a file.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
+                    "file_path": _PROP_FILE_PATH,
                 },
                 "required": ["file_path"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="lsp_workspace_symbols",
             description="Search for symbols by name across the entire workspace.",
             inputSchema={
@@ -732,70 +812,34 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
-            name="lsp_prepare_rename",
-            description="Check if a symbol at position can be renamed. Use before lsp_rename.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
+        _lsp_position_tool(
+            "lsp_prepare_rename",
+            "Check if a symbol at position can be renamed. Use before lsp_rename.",
+        ),
+        _lsp_position_tool(
+            "lsp_rename",
+            "Rename a symbol across the workspace. Use lsp_prepare_rename first to validate.",
+            {
+                "new_name": {"type": "string", "description": "New name for the symbol"},
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Preview changes without applying",
+                    "default": True,
                 },
-                "required": ["file_path", "line", "character"],
             },
-                    meta={"defer_loading": True},
+            extra_required=("new_name",),
         ),
-        Tool(
-            name="lsp_rename",
-            description="Rename a symbol across the workspace. Use lsp_prepare_rename first to validate.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
-                    "new_name": {"type": "string", "description": "New name for the symbol"},
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "Preview changes without applying",
-                        "default": True,
-                    },
-                },
-                "required": ["file_path", "line", "character", "new_name"],
-            },
-                    meta={"defer_loading": True},
+        _lsp_position_tool(
+            "lsp_code_actions",
+            "Get available quick fixes and refactorings at a position.",
         ),
-        Tool(
-            name="lsp_code_actions",
-            description="Get available quick fixes and refactorings at a position.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
-                    "line": {"type": "integer", "description": "Line number (1-indexed)"},
-                    "character": {
-                        "type": "integer",
-                        "description": "Character position (0-indexed)",
-                    },
-                },
-                "required": ["file_path", "line", "character"],
-            },
-                    meta={"defer_loading": True},
-        ),
-        Tool(
+        _construct_tool(
             name="lsp_code_action_resolve",
             description="Apply a specific code action/fix to a file (e.g., fix F401 unused import).",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
+                    "file_path": _PROP_FILE_PATH,
                     "action_code": {
                         "type": "string",
                         "description": "Code action ID to apply (e.g., 'F401', 'E501' for Python)",
@@ -809,13 +853,13 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="lsp_extract_refactor",
             description="Extract code to a function or variable (Python via jedi).",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "file_path": {"type": "string", "description": "Absolute path to the file"},
+                    "file_path": _PROP_FILE_PATH,
                     "start_line": {"type": "integer", "description": "Start line (1-indexed)"},
                     "start_char": {"type": "integer", "description": "Start character (0-indexed)"},
                     "end_line": {"type": "integer", "description": "End line (1-indexed)"},
@@ -840,16 +884,13 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="lsp_servers",
             description="List available LSP servers and their installation status.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="ast_grep_replace",
             description="Replace code patterns using ast-grep's AST-aware replacement. More reliable than text-based replace for refactoring.",
             inputSchema={
@@ -883,7 +924,7 @@ def get_tool_definitions() -> list[Tool]:
                     meta={"defer_loading": True},
         ),
         # --- SEMANTIC SEARCH ---
-        Tool(
+        _construct_tool(
             name="semantic_search",
             description=(
                 "Search codebase using natural language queries. Uses vector embeddings to find "
@@ -898,16 +939,8 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Natural language search query (e.g., 'find authentication logic')",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
-                    "n_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10,
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
+                    "n_results": _PROP_N_RESULTS,
                     "language": {
                         "type": "string",
                         "description": "Filter by language (e.g., 'py', 'ts', 'js')",
@@ -916,18 +949,13 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Filter by node type (e.g., 'function', 'class', 'method')",
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
                 "required": ["query"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="hybrid_search",
             description=(
                 "Hybrid search combining semantic similarity with structural AST matching. "
@@ -945,16 +973,8 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "ast-grep pattern for structural matching (optional)",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
-                    "n_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10,
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
+                    "n_results": _PROP_N_RESULTS,
                     "language": {
                         "type": "string",
                         "description": "Filter by language (e.g., 'py', 'ts', 'js')",
@@ -975,18 +995,13 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Filter by base class (e.g., 'BaseClass')",
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
                 "required": ["query"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="find_code",
             description=(
                 "Smart code search with automatic routing to optimal search strategy. "
@@ -1008,20 +1023,12 @@ def get_tool_definitions() -> list[Tool]:
                         "enum": ["auto", "ast", "semantic", "hybrid", "grep", "exact"],
                         "default": "auto",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                     "language": {
                         "type": "string",
                         "description": "Filter by language (e.g., 'py', 'ts', 'js')",
                     },
-                    "n_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10,
-                    },
+                    "n_results": _PROP_N_RESULTS,
                     "provider": {
                         "type": "string",
                         "description": "Embedding provider for semantic search: ollama (default), gemini, openai",
@@ -1032,7 +1039,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="semantic_index",
             description=(
                 "Index a codebase for semantic search. Creates vector embeddings for all code files. "
@@ -1041,48 +1048,30 @@ def get_tool_definitions() -> list[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                     "force": {
                         "type": "boolean",
                         "description": "If true, reindex everything. Otherwise, only new/changed files.",
                         "default": False,
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="semantic_stats",
             description="Get statistics about the semantic search index for a project.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="start_file_watcher",
             description=(
                 "Start automatic background reindexing when code files change. "
@@ -1092,17 +1081,8 @@ def get_tool_definitions() -> list[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                     "debounce_seconds": {
                         "type": "number",
                         "description": "Wait time after file changes before reindexing (default: 2.0)",
@@ -1112,22 +1092,18 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="stop_file_watcher",
             description="Stop the file watcher for a project.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                 },
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="cancel_indexing",
             description=(
                 "Cancel an ongoing semantic indexing operation. "
@@ -1136,11 +1112,7 @@ def get_tool_definitions() -> list[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                     "provider": {
                         "type": "string",
                         "description": "Embedding provider (must match the one used for indexing)",
@@ -1151,7 +1123,7 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="delete_index",
             description=(
                 "Delete semantic search index(es). Can delete for specific project+provider, "
@@ -1179,16 +1151,13 @@ def get_tool_definitions() -> list[Tool]:
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="list_file_watchers",
             description="List all active file watchers across all projects.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
             meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="multi_query_search",
             description=(
                 "Search with LLM-expanded query variations for better recall. "
@@ -1203,16 +1172,8 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Natural language search query",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
-                    "n_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10,
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
+                    "n_results": _PROP_N_RESULTS,
                     "num_expansions": {
                         "type": "integer",
                         "description": "Number of query variations to generate",
@@ -1226,18 +1187,13 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Filter by node type (e.g., 'function', 'class')",
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
                 "required": ["query"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="decomposed_search",
             description=(
                 "Search by decomposing complex queries into focused sub-questions. "
@@ -1252,11 +1208,7 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Complex search query (may contain multiple concepts)",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                     "n_results": {
                         "type": "integer",
                         "description": "Maximum results per sub-query",
@@ -1270,18 +1222,13 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Filter by node type",
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
                 "required": ["query"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="enhanced_search",
             description=(
                 "Unified enhanced search combining query expansion and decomposition. "
@@ -1296,11 +1243,7 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Search query (simple or complex)",
                     },
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project root",
-                        "default": ".",
-                    },
+                    "project_path": _PROP_PROJECT_PATH,
                     "n_results": {
                         "type": "integer",
                         "description": "Maximum number of results",
@@ -1320,18 +1263,13 @@ def get_tool_definitions() -> list[Tool]:
                         "type": "string",
                         "description": "Filter by node type",
                     },
-                    "provider": {
-                        "type": "string",
-                        "description": "Embedding provider: ollama/mxbai (local/free), gemini (cloud/OAuth), openai (cloud/OAuth), huggingface (cloud)",
-                        "enum": ["ollama", "mxbai", "gemini", "openai", "huggingface"],
-                        "default": "ollama",
-                    },
+                    "provider": _PROP_EMBEDDING_PROVIDER,
                 },
                 "required": ["query"],
             },
                     meta={"defer_loading": True},
         ),
-        Tool(
+        _construct_tool(
             name="get_cost_report",
             description="Get a cost report for the current or specified session, breaking down token usage and cost by agent.",
             inputSchema={
@@ -1348,10 +1286,9 @@ def get_tool_definitions() -> list[Tool]:
     ]
 
 
-def get_prompt_definitions() -> list[Prompt]:
-    """Return all Prompt definitions for the Stravinsky MCP server."""
-    return [
-        Prompt(
+def _build_prompt_definitions() -> tuple[Prompt, ...]:
+    return (
+        Prompt.model_construct(
             name="stravinsky",
             description=(
                 "Stravinsky - Powerful AI orchestrator. "
@@ -1360,7 +1297,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="delphi",
             description=(
                 "Delphi - Strategic advisor using GPT for debugging, "
@@ -1368,7 +1305,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="dewey",
             description=(
                 "Dewey - Documentation and GitHub research specialist. "
@@ -1376,7 +1313,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="explore",
             description=(
                 "Explore - Fast codebase search specialist. "
@@ -1384,7 +1321,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="frontend",
             description=(
                 "Frontend UI/UX Engineer - Designer-turned-developer for stunning visuals. "
@@ -1392,7 +1329,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="document_writer",
             description=(
                 "Document Writer - Technical documentation specialist. "
@@ -1400,7 +1337,7 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-        Prompt(
+        Prompt.model_construct(
             name="multimodal",
             description=(
                 "Multimodal Looker - Visual content analysis. "
@@ -1408,4 +1345,4 @@ def get_prompt_definitions() -> list[Prompt]:
             ),
             arguments=[],
         ),
-    ]
+    )
@@ -1,20 +1,68 @@
 # Tools module
-from .agent_manager import (
-    agent_cancel,
-    agent_list,
-    agent_output,
-    agent_progress,
-    agent_retry,
-    agent_spawn,
-)
-from .background_tasks import task_list, task_spawn, task_status
-from .code_search import ast_grep_replace, ast_grep_search, glob_files, grep_search, lsp_diagnostics
-from .continuous_loop import disable_ralph_loop, enable_ralph_loop
-from .model_invoke import invoke_gemini, invoke_gemini_agentic, invoke_openai
-from .query_classifier import QueryCategory, QueryClassification, classify_query
-from .session_manager import get_session_info, list_sessions, read_session, search_sessions
-from .skill_loader import create_skill, get_skill, list_skills
-from .tool_search import format_search_results, search_tool_names, search_tools
+#
+# Exports are resolved on first access so that importing one tool does not
+# load every other tool module (and the SDKs they depend on).
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent_manager import (
+        agent_cancel,
+        agent_list,
+        agent_output,
+        agent_progress,
+        agent_retry,
+        agent_spawn,
+    )
+    from .background_tasks import task_list, task_spawn, task_status
+    from .code_search import (
+        ast_grep_replace,
+        ast_grep_search,
+        glob_files,
+        grep_search,
+        lsp_diagnostics,
+    )
+    from .continuous_loop import disable_ralph_loop, enable_ralph_loop
+    from .model_invoke import invoke_gemini, invoke_gemini_agentic, invoke_openai
+    from .query_classifier import QueryCategory, QueryClassification, classify_query
+    from .session_manager import get_session_info, list_sessions, read_session, search_sessions
+    from .skill_loader import create_skill, get_skill, list_skills
+    from .tool_search import format_search_results, search_tool_names, search_tools
+
+_LAZY = {
+    "agent_cancel": "agent_manager",
+    "agent_list": "agent_manager",
+    "agent_output": "agent_manager",
+    "agent_progress": "agent_manager",
+    "agent_retry": "agent_manager",
+    "agent_spawn": "agent_manager",
+    "task_list": "background_tasks",
+    "task_spawn": "background_tasks",
+    "task_status": "background_tasks",
+    "ast_grep_replace": "code_search",
+    "ast_grep_search": "code_search",
+    "glob_files": "code_search",
+    "grep_search": "code_search",
+    "lsp_diagnostics": "code_search",
+    "disable_ralph_loop": "continuous_loop",
+    "enable_ralph_loop": "continuous_loop",
+    "invoke_gemini": "model_invoke",
+    "invoke_gemini_agentic": "model_invoke",
+    "invoke_openai": "model_invoke",
+    "QueryCategory": "query_classifier",
+    "QueryClassification": "query_classifier",
+    "classify_query": "query_classifier",
+    "get_session_info": "session_manager",
+    "list_sessions": "session_manager",
+    "read_session": "session_manager",
+    "search_sessions": "session_manager",
+    "create_skill": "skill_loader",
+    "get_skill": "skill_loader",
+    "list_skills": "skill_loader",
+    "format_search_results": "tool_search",
+    "search_tool_names": "tool_search",
+    "search_tools": "tool_search",
+}
 
 __all__ = [
     "QueryCategory",
@@ -51,3 +99,15 @@ __all__ = [
     "task_status",
 ]
 
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
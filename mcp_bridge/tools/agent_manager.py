@@ -11,15 +11,20 @@ import os
 import shutil
 import signal
 import asyncio
+import atexit
+import contextlib
+import hashlib
 import sys
 import threading
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, List, Dict
 import subprocess
+from ..utils.json_codec import dumps, loads
 from .mux_client import get_mux, MuxClient
 try:
     from . import semantic_search
@@ -29,6 +34,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Task statuses that mean the agent has not finished yet
+_ACTIVE_STATUSES = frozenset({"pending", "running"})
+
 
 # Output formatting modes
 class OutputMode(Enum):
@@ -131,10 +139,47 @@ class Colors:
     BRIGHT_WHITE = "\033[97m"
 
 
+# Honour NO_COLOR (https://no-color.org) and STRAVINSKY_NO_COLOR. There is no TTY
+# check: stdout is the MCP protocol pipe, so one would disable colour for every client.
+_USE_COLOR = not (os.environ.get("NO_COLOR") or os.environ.get("STRAVINSKY_NO_COLOR"))
+
+
+@dataclass(frozen=True, slots=True)
+class AgentMeta:
+    """Routing and display data for one agent type, resolved from the tables above."""
+
+    cli_model: str | None
+    cost_tier: str
+    cost_emoji: str
+    display_model: str
+
+
+def _resolve_agent_meta(agent_type: str) -> AgentMeta:
+    cost_tier = AGENT_COST_TIERS.get(agent_type, AGENT_COST_TIERS["_default"])
+    return AgentMeta(
+        cli_model=AGENT_MODEL_ROUTING.get(agent_type, AGENT_MODEL_ROUTING["_default"]),
+        cost_tier=cost_tier,
+        cost_emoji=COST_TIER_EMOJI.get(cost_tier, "⚪"),
+        display_model=AGENT_DISPLAY_MODELS.get(agent_type, AGENT_DISPLAY_MODELS["_default"]),
+    )
+
+
+AGENT_META = {
+    agent_type: _resolve_agent_meta(agent_type)
+    for agent_type in (
+        AGENT_MODEL_ROUTING.keys() | AGENT_COST_TIERS.keys() | AGENT_DISPLAY_MODELS.keys()
+    )
+}
+
+
+def get_agent_meta(agent_type: str) -> AgentMeta:
+    """Get routing and display data for an agent type (unknown types use _default)."""
+    return AGENT_META.get(agent_type) or AGENT_META["_default"]
+
+
 def get_agent_emoji(agent_type: str) -> str:
     """Get the colored emoji indicator for an agent based on its cost tier."""
-    cost_tier = AGENT_COST_TIERS.get(agent_type, AGENT_COST_TIERS["_default"])
-    return COST_TIER_EMOJI.get(cost_tier, "⚪")
+    return get_agent_meta(agent_type).cost_emoji
 
 
 def get_model_emoji(model_name: str) -> str:
@@ -234,6 +279,8 @@ def colorize_agent_spawn_message(
     task_id: str,
 ) -> str:
     short_desc = (description or "")[:50].strip()
+    if not _USE_COLOR:
+        return f"{cost_emoji} {agent_type}:{display_model}('{short_desc}') ⏳\ntask_id={task_id}"
     colored_message = (
         f"{cost_emoji} "
         f"{Colors.CYAN}{agent_type}{Colors.RESET}:"
@@ -254,8 +301,9 @@ def format_spawn_output(
     if mode == OutputMode.SILENT:
         return ""
 
-    cost_emoji = get_agent_emoji(agent_type)
     if mode == OutputMode.CLEAN:
+        if not _USE_COLOR:
+            return f"✓ {agent_type}:{display_model} → {task_id}"
         return (
             f"{Colors.GREEN}✓{Colors.RESET} "
             f"{Colors.CYAN}{agent_type}{Colors.RESET}:"
@@ -265,6 +313,28 @@ def format_spawn_output(
     return ""
 
 
+def _tail_lines(path: Path, lines: int, chunk_size: int = 8192) -> list[str]:
+    """Return the last `lines` lines of a file, reading only as much of its end as needed."""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        start = end
+        data = b""
+        # Read backwards until the window holds `lines` complete lines.
+        while start > 0 and data.rstrip().count(b"\n") < lines:
+            start = max(0, start - chunk_size)
+            f.seek(start)
+            data = f.read(end - start)
+    text = data.decode("utf-8", errors="replace")
+    # Unless we read from the top, the first line may be cut off mid-way: drop it.
+    text = text[text.find("\n") + 1 :].rstrip() if start > 0 else text.strip()
+    return text.split("\n")[-lines:]
+
+
+def _resolve_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 @dataclass
 class AgentTask:
     id: str
@@ -284,8 +354,33 @@ class AgentTask:
     progress: dict[str, Any] | None = None
 
 
+def _max_concurrent_agents(default: int = 16) -> int:
+    """Read STRAVINSKY_MAX_AGENTS, falling back to default when it is not an integer."""
+    value = os.environ.get("STRAVINSKY_MAX_AGENTS")
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        logger.warning(f"Ignoring STRAVINSKY_MAX_AGENTS={value!r}: not an integer, using {default}")
+        return default
+    if limit < 1:
+        # With no run slots every spawn would wait forever.
+        logger.warning(f"STRAVINSKY_MAX_AGENTS={limit} is below 1, using 1")
+        return 1
+    return limit
+
+
 class AgentManager:
     CLAUDE_CLI = shutil.which("claude") or "/opt/homebrew/bin/claude"
+    # Task updates arriving within this many seconds reach disk as one write.
+    SAVE_DELAY = 0.2
+    # stdout lines kept in memory per running agent for get_progress.
+    RECENT_OUTPUT_LINES = 256
+    # Seconds between flushes of a running agent's .out file.
+    OUTPUT_FLUSH_INTERVAL = 1.0
+    # Agent subprocesses allowed to run at once; later spawns wait as "pending".
+    MAX_CONCURRENT_AGENTS = _max_concurrent_agents()
 
     def __init__(self, base_dir: str | None = None):
         self._lock = threading.RLock()
@@ -306,14 +401,38 @@ class AgentManager:
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.agents_dir.mkdir(parents=True, exist_ok=True)
 
-        if not self.state_file.exists():
-            self._save_tasks({})
+        # Task state lives in memory; the state file is written behind it by
+        # a writer thread so bursts of updates cost one write, not one each.
+        # Every stravinsky process in the Claude Code session shares the file,
+        # so writes merge the tasks changed or removed here into what is on
+        # disk (see flush_tasks) rather than overwrite it.
+        self._task_state: dict[str, Any] = self._read_state_file()
+        self._state_dirty = False
+        self._dirty_ids: set[str] = set()
+        self._removed_ids: set[str] = set()
+        self._save_event = threading.Event()
+        self._save_thread: threading.Thread | None = None
+        self._write_lock = threading.Lock()
 
         self._processes: dict[str, Any] = {} 
         self._notification_queue: dict[str, list[dict[str, Any]]] = {}
         self._tasks: dict[str, asyncio.Task] = {}
         self._progress_monitors: dict[str, asyncio.Task] = {}
         self._stop_monitors = asyncio.Event()
+        self._background_loop: asyncio.AbstractEventLoop | None = None
+        # Last stdout lines of each running agent, so get_progress needs no file I/O.
+        self._recent_output: dict[str, deque[str]] = {}
+        # Futures resolved when a task finishes, for get_output(block=True).
+        self._done_waiters: dict[str, list[asyncio.Future]] = {}
+        # Agents holding a run slot, and futures of agents waiting for one.
+        # Agents may run on different loops, so this is not an asyncio.Semaphore.
+        self._running_agents = 0
+        self._slot_waiters: list[asyncio.Future] = []
+
+        if not self.state_file.exists():
+            self._state_dirty = True
+            self.flush_tasks()
+        atexit.register(self.flush_tasks)
 
         try:
             self._sync_cleanup(max_age_minutes=30)
@@ -359,31 +478,153 @@ class AgentManager:
                     except: continue
         if removed_ids:
             self._save_tasks(tasks)
+        self._prune_system_prompt_files(max_age_minutes)
+
+    def _prune_system_prompt_files(self, max_age_minutes: int):
+        """Remove system prompt files (and stray temp files) not used for max_age_minutes."""
+        cutoff = time.time() - max_age_minutes * 60
+        for path in self.agents_dir.glob("sys_*.prompt*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _read_state_file(self) -> dict[str, Any]:
+        try:
+            return loads(self.state_file.read_bytes())
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
 
     def _load_tasks(self) -> dict[str, Any]:
+        """Return a copy of all tasks that the caller may modify."""
         with self._lock:
-            try:
-                if not self.state_file.exists():
-                    return {}
-                with open(self.state_file) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
+            return {task_id: dict(task) for task_id, task in self._task_state.items()}
 
     def _save_tasks(self, tasks: dict[str, Any]):
-        with self._lock, open(self.state_file, "w") as f:
-            json.dump(tasks, f, indent=2)
+        with self._lock:
+            old_state = self._task_state
+            removed = old_state.keys() - tasks.keys()
+            self._removed_ids |= removed
+            self._dirty_ids -= removed
+            for task_id, task in tasks.items():
+                if old_state.get(task_id) != task:
+                    self._dirty_ids.add(task_id)
+                    self._removed_ids.discard(task_id)
+            self._task_state = tasks
+            self._schedule_save()
+            self._wake_waiters()
 
     def _update_task(self, task_id: str, **kwargs):
         with self._lock:
-            tasks = self._load_tasks()
-            if task_id in tasks:
-                tasks[task_id].update(kwargs)
-                self._save_tasks(tasks)
+            task = self._task_state.get(task_id)
+            if task is not None:
+                task.update(kwargs)
+                self._dirty_ids.add(task_id)
+                self._schedule_save()
+                if "status" in kwargs:
+                    self._wake_waiters((task_id,))
+
+    def _wake_waiters(self, task_ids=None):
+        """Resolve get_output waiters whose task has finished or been removed."""
+        waiters = []
+        with self._lock:
+            for task_id in list(self._done_waiters) if task_ids is None else task_ids:
+                task = self._task_state.get(task_id)
+                if task is None or task.get("status") not in _ACTIVE_STATUSES:
+                    waiters.extend(self._done_waiters.pop(task_id, ()))
+        for waiter in waiters:
+            # Waiters may belong to another loop (see spawn()), possibly closed by now.
+            with contextlib.suppress(RuntimeError):
+                waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
+
+    async def _wait_for_completion(self, task_id: str, timeout: float):
+        """Wait until the task leaves pending/running, it disappears, or timeout passes."""
+        waiter = asyncio.get_running_loop().create_future()
+        with self._lock:
+            task = self._task_state.get(task_id)
+            if task is None or task.get("status") not in _ACTIVE_STATUSES:
+                return
+            self._done_waiters.setdefault(task_id, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            with self._lock:
+                waiters = self._done_waiters.get(task_id, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+
+    def _schedule_save(self):
+        """Mark the task state dirty and wake the writer thread."""
+        with self._lock:
+            self._state_dirty = True
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_loop, name="agent-state-writer", daemon=True
+                )
+                self._save_thread.start()
+        self._save_event.set()
+
+    def _save_loop(self):
+        while True:
+            self._save_event.wait()
+            time.sleep(self.SAVE_DELAY)
+            self._save_event.clear()
+            self.flush_tasks()
+
+    def flush_tasks(self):
+        """
+        Write pending task state to the state file now.
+
+        Only tasks changed or removed by this process are written over the file's
+        current contents, so other processes sharing it keep their updates. Their
+        tasks are then picked up into memory.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._state_dirty:
+                    return
+                changed = {
+                    task_id: dict(self._task_state[task_id])
+                    for task_id in self._dirty_ids
+                    if task_id in self._task_state
+                }
+                removed = self._removed_ids
+                self._dirty_ids, self._removed_ids = set(), set()
+                self._state_dirty = False
+                # A missing file was deleted or never written: rebuild it from memory.
+                base = None
+                if not self.state_file.exists():
+                    base = {task_id: dict(task) for task_id, task in self._task_state.items()}
+
+            merged = self._read_state_file() if base is None else base
+            for task_id in removed:
+                merged.pop(task_id, None)
+            merged.update(changed)
+            tmp_file = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+            try:
+                tmp_file.write_text(dumps(merged))
+                os.replace(tmp_file, self.state_file)
+            except OSError as e:
+                logger.debug(f"Failed to write agent state {self.state_file}: {e}")
+
+            with self._lock:
+                # Keep whatever changed here while the file was being written.
+                state = {
+                    task_id: task
+                    for task_id, task in merged.items()
+                    if task_id not in self._removed_ids
+                }
+                for task_id in self._dirty_ids:
+                    if task_id in self._task_state:
+                        state[task_id] = self._task_state[task_id]
+                self._task_state = state
+                self._wake_waiters()
 
     def get_task(self, task_id: str) -> dict[str, Any] | None:
-        tasks = self._load_tasks()
-        return tasks.get(task_id)
+        with self._lock:
+            task = self._task_state.get(task_id)
+            return dict(task) if task is not None else None
 
     def list_tasks(
         self,
@@ -391,15 +632,15 @@ class AgentManager:
         show_all: bool = True,
         current_session_only: bool = True,
     ) -> list[dict[str, Any]]:
-        tasks = self._load_tasks()
-        task_list = list(tasks.values())
-        if current_session_only:
-            task_list = [t for t in task_list if t.get("terminal_session_id") == self.session_id]
-        if parent_session_id:
-            task_list = [t for t in task_list if t.get("parent_session_id") == parent_session_id]
-        if not show_all:
-            task_list = [t for t in task_list if t.get("status") in ["running", "pending"]]
-        return task_list
+        # Filter the live state in one pass and copy only the matches.
+        with self._lock:
+            return [
+                dict(t)
+                for t in self._task_state.values()
+                if (not current_session_only or t.get("terminal_session_id") == self.session_id)
+                and (not parent_session_id or t.get("parent_session_id") == parent_session_id)
+                and (show_all or t.get("status") in _ACTIVE_STATUSES)
+            ]
 
     async def spawn_async(
         self,
@@ -465,19 +706,28 @@ class AgentManager:
 
         return task_id
 
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the manager's own event loop, started on a daemon thread on first use."""
+        with self._lock:
+            if self._background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="agent-manager-loop", daemon=True
+                ).start()
+                self._background_loop = loop
+            return self._background_loop
+
     def spawn(self, *args, **kwargs) -> str:
-        try:
-            loop = asyncio.get_running_loop()
-            task_id_ref = [None]
-            async def wrap():
-                task_id_ref[0] = await self.spawn_async(*args, **kwargs)
-            
-            thread = threading.Thread(target=lambda: asyncio.run(wrap()))
-            thread.start()
-            thread.join()
-            return task_id_ref[0]
-        except RuntimeError:
-            return asyncio.run(self.spawn_async(*args, **kwargs))
+        """
+        Spawn an agent from synchronous code.
+
+        The agent runs on the manager's background loop, so it keeps running
+        after this returns (a throwaway asyncio.run() loop would cancel it).
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.spawn_async(*args, **kwargs), self._get_background_loop()
+        )
+        return future.result()
 
     async def _execute_agent_async(
         self,
@@ -493,10 +743,17 @@ class AgentManager:
         self.agents_dir.mkdir(parents=True, exist_ok=True)
         log_file = self.agents_dir / f"{task_id}.log"
         output_file = self.agents_dir / f"{task_id}.out"
-
-        self._update_task(task_id, status="running", started_at=datetime.now().isoformat())
+        slot_acquired = False
 
         try:
+            await self._acquire_run_slot()
+            slot_acquired = True
+            task = self.get_task(task_id)
+            if not task or task["status"] != "pending":
+                # Cancelled while waiting for a slot
+                return
+            self._update_task(task_id, status="running", started_at=datetime.now().isoformat())
+
             full_prompt = prompt
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n---\n\n{prompt}"
@@ -510,7 +767,7 @@ class AgentManager:
                 "--dangerously-skip-permissions",
             ]
 
-            cli_model = AGENT_MODEL_ROUTING.get(agent_type, AGENT_MODEL_ROUTING.get("_default", "sonnet"))
+            cli_model = get_agent_meta(agent_type).cli_model
             if cli_model:
                 cmd.extend(["--model", cli_model])
 
@@ -518,8 +775,7 @@ class AgentManager:
                 cmd.extend(["--thinking-budget", str(thinking_budget)])
 
             if system_prompt:
-                system_file = self.agents_dir / f"{task_id}.system"
-                system_file.write_text(system_prompt)
+                system_file = self._system_prompt_file(system_prompt)
                 cmd.extend(["--system-prompt", str(system_file)])
 
             logger.info(f"[AgentManager] Spawning {task_id}: {' '.join(cmd[:3])}...")
@@ -537,30 +793,46 @@ class AgentManager:
             self._processes[task_id] = process
             self._update_task(task_id, pid=process.pid)
             
-            # Streaming read loop for Mux
-            stdout_buffer = []
+            # Streaming read loop for Mux. stdout goes to the .out file, flushed
+            # at most every OUTPUT_FLUSH_INTERVAL seconds rather than per line so
+            # the event loop is not blocked on disk writes; get_progress reads
+            # the in-memory tail while the agent runs. stderr is kept in memory
+            # for the error message.
             stderr_buffer = []
+            recent = self._recent_output[task_id] = deque(maxlen=self.RECENT_OUTPUT_LINES)
             mux = MuxClient(task_id)
             mux.connect()
             
-            async def read_stream(stream, buffer, stream_name):
+            async def read_stream(stream, write, stream_name):
                 while True:
                     line = await stream.readline()
                     if not line:
                         break
                     decoded = line.decode('utf-8', errors='replace')
-                    buffer.append(decoded)
+                    write(decoded)
                     mux.log(decoded.strip(), stream_name)
             
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(
-                        read_stream(process.stdout, stdout_buffer, "stdout"),
-                        read_stream(process.stderr, stderr_buffer, "stderr"),
-                        process.wait()
-                    ),
-                    timeout=timeout
-                )
+                with open(output_file, "w") as out:
+                    last_flush = time.monotonic()
+
+                    def write_stdout(line: str):
+                        nonlocal last_flush
+                        out.write(line)
+                        recent.append(line.rstrip("\n"))
+                        now = time.monotonic()
+                        if now - last_flush >= self.OUTPUT_FLUSH_INTERVAL:
+                            out.flush()
+                            last_flush = now
+
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            read_stream(process.stdout, write_stdout, "stdout"),
+                            read_stream(process.stderr, stderr_buffer.append, "stderr"),
+                            process.wait()
+                        ),
+                        timeout=timeout
+                    )
             except asyncio.TimeoutError:
                 try:
                     os.killpg(os.getpgid(process.pid), signal.SIGKILL)
@@ -572,18 +844,16 @@ class AgentManager:
                 self._update_task(task_id, status="failed", error=error_msg, completed_at=datetime.now().isoformat())
                 return
 
-            stdout = "".join(stdout_buffer)
             stderr = "".join(stderr_buffer)
             
             if stderr:
                 log_file.write_text(stderr)
 
             if process.returncode == 0:
-                output_file.write_text(stdout)
                 self._update_task(
                     task_id,
                     status="completed",
-                    result=stdout.strip(),
+                    result=output_file.read_text().strip(),
                     completed_at=datetime.now().isoformat(),
                 )
             else:
@@ -613,10 +883,53 @@ class AgentManager:
             output_file.write_text(f"❌ EXCEPTION: {error_msg}")
             self._update_task(task_id, status="failed", error=error_msg, completed_at=datetime.now().isoformat())
         finally:
+            if slot_acquired:
+                self._release_run_slot()
             self._processes.pop(task_id, None)
+            self._recent_output.pop(task_id, None)
             self._tasks.pop(task_id, None)
             self._notify_completion(task_id)
 
+    async def _acquire_run_slot(self):
+        """Wait until fewer than MAX_CONCURRENT_AGENTS agents are running, then take a slot."""
+        while True:
+            with self._lock:
+                if self._running_agents < self.MAX_CONCURRENT_AGENTS:
+                    self._running_agents += 1
+                    return
+                waiter = asyncio.get_running_loop().create_future()
+                self._slot_waiters.append(waiter)
+            await waiter
+
+    def _release_run_slot(self):
+        with self._lock:
+            self._running_agents -= 1
+            waiters, self._slot_waiters = self._slot_waiters, []
+        # Wake every waiter to retry: one woken alone may already be cancelled.
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
+
+    def _system_prompt_file(self, system_prompt: str) -> Path:
+        """
+        Return a file holding system_prompt, shared by every agent with the same prompt.
+
+        The file is written to a temporary name and renamed into place, so a
+        concurrent spawn never passes a half-written file to the CLI. Reusing a file
+        refreshes its mtime, which _sync_cleanup() reads as "last used" when it
+        prunes prompt files that no agent has needed for a while.
+        """
+        digest = hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+        system_file = self.agents_dir / f"sys_{digest}.prompt"
+        try:
+            os.utime(system_file)
+        except FileNotFoundError:
+            tmp_file = system_file.with_name(
+                f"{system_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_file.write_text(system_prompt)
+            os.replace(tmp_file, system_file)
+        return system_file
+
     def _notify_completion(self, task_id: str):
         task = self.get_task(task_id)
         if task and task.get("parent_session_id"):
@@ -632,7 +945,7 @@ class AgentManager:
 
         while not self._stop_monitors.is_set():
             task = self.get_task(task_id)
-            if not task or task["status"] not in ["running", "pending"]:
+            if not task or task["status"] not in _ACTIVE_STATUSES:
                 # Final status reporting...
                 break
             
@@ -648,7 +961,7 @@ class AgentManager:
 
     def cancel(self, task_id: str) -> bool:
         task = self.get_task(task_id)
-        if not task or task["status"] not in ["pending", "running"]:
+        if not task or task["status"] not in _ACTIVE_STATUSES:
             return False
 
         process = self._processes.get(task_id)
@@ -660,7 +973,8 @@ class AgentManager:
             
         async_task = self._tasks.get(task_id)
         if async_task:
-            async_task.cancel()
+            # Agents started by spawn() live on the background loop.
+            async_task.get_loop().call_soon_threadsafe(async_task.cancel)
             
         self._update_task(task_id, status="cancelled", completed_at=datetime.now().isoformat())
         return True
@@ -670,14 +984,16 @@ class AgentManager:
         stopped_count = 0
         for task_id, task in list(tasks.items()):
             status = task.get("status")
-            if status in ["pending", "running"]:
+            if status in _ACTIVE_STATUSES:
                 if self.cancel(task_id):
                     stopped_count += 1
         
         self._stop_monitors.set()
         
-        if self._tasks:
-            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        local_tasks = [t for t in self._tasks.values() if t.get_loop() is loop]
+        if local_tasks:
+            await asyncio.gather(*local_tasks, return_exceptions=True)
         if self._progress_monitors:
             await asyncio.gather(*self._progress_monitors.values(), return_exceptions=True)
             
@@ -716,7 +1032,7 @@ class AgentManager:
                         if (now - completed_time).total_seconds() / 60 > max_age_minutes:
                             removed_ids.append(task_id)
                             del tasks[task_id]
-                            for ext in [".log", ".out", ".system"]:
+                            for ext in [".log", ".out"]:
                                 (self.agents_dir / f"{task_id}{ext}").unlink(missing_ok=True)
                     except: continue
         if removed_ids: self._save_tasks(tasks)
@@ -726,18 +1042,13 @@ class AgentManager:
         task = self.get_task(task_id)
         if not task: return f"Task {task_id} not found."
 
-        if block and task["status"] in ["pending", "running"]:
-            start = time.time()
-            while (time.time() - start) < timeout:
-                task = self.get_task(task_id)
-                if not task or task["status"] not in ["pending", "running"]: break
-                await asyncio.sleep(0.5)
+        if block and task["status"] in _ACTIVE_STATUSES:
+            await self._wait_for_completion(task_id, timeout)
 
         task = self.get_task(task_id)
         status = task["status"]
         agent_type = task.get("agent_type", "unknown")
-        cost_emoji = get_agent_emoji(agent_type)
-        display_model = AGENT_DISPLAY_MODELS.get(agent_type, AGENT_DISPLAY_MODELS["_default"])
+        cost_emoji = get_agent_meta(agent_type).cost_emoji
 
         if status == "completed":
             res = task.get("result", "")
@@ -753,10 +1064,13 @@ class AgentManager:
         if not task: return f"Task {task_id} not found."
         output_file = self.agents_dir / f"{task_id}.out"
         output_content = ""
-        if output_file.exists():
+        recent = self._recent_output.get(task_id)
+        if recent is not None and lines <= self.RECENT_OUTPUT_LINES:
+            text = "\n".join(list(recent)).strip()
+            output_content = "\n".join(text.split("\n")[-lines:])
+        elif output_file.exists():
             try:
-                text = output_file.read_text()
-                output_content = "\n".join(text.strip().split("\n")[-lines:])
+                output_content = "\n".join(_tail_lines(output_file, lines))
             except: pass
         return f"**Agent Progress**\nID: {task_id}\nStatus: {task['status']}\n\nOutput:\n```\n{output_content}\n```"
 
@@ -773,6 +1087,18 @@ def get_manager() -> AgentManager:
     return _manager
 
 
+_token_store = None
+
+
+def _get_token_store():
+    global _token_store
+    if _token_store is None:
+        from ..auth.token_store import TokenStore
+
+        _token_store = TokenStore()
+    return _token_store
+
+
 async def agent_spawn(
     prompt: str,
     agent_type: str = "explore",
@@ -794,10 +1120,8 @@ async def agent_spawn(
     if required_tools: validate_agent_tools(agent_type, required_tools)
     if spawning_agent: validate_agent_hierarchy(spawning_agent, agent_type)
     system_prompt = f"You are a {agent_type} specialist." 
-    from ..auth.token_store import TokenStore
-    token_store = TokenStore()
     task_id = await manager.spawn_async(
-        token_store=token_store,
+        token_store=_get_token_store(),
         prompt=prompt,
         agent_type=agent_type,
         description=description,
@@ -810,8 +1134,7 @@ async def agent_spawn(
         manager._progress_monitors[task_id] = monitor_task
     if blocking:
         return await manager.get_output(task_id, block=True, timeout=timeout)
-    display_model = AGENT_DISPLAY_MODELS.get(agent_type, AGENT_DISPLAY_MODELS["_default"])
-    return format_spawn_output(agent_type, display_model, task_id)
+    return format_spawn_output(agent_type, get_agent_meta(agent_type).display_model, task_id)
 
 
 async def agent_output(task_id: str, block: bool = False, auto_cleanup: bool = False) -> str:
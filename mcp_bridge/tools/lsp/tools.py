@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote, urlparse
+from mcp_bridge.utils.cache import IOCache
 from mcp_bridge.utils.process import async_execute
 
 # Use lsprotocol for types
@@ -102,6 +103,20 @@ def _find_project_root(file_path: str) -> str | None:
     return None
 
 
+def _file_cache_key(tool: str, file_path: str, *parts: Any) -> str | None:
+    """
+    IOCache key for a language server answer that depends only on one file.
+
+    The file's mtime is part of the key, so editing the file misses the cache,
+    and the real path keeps IOCache.invalidate_path() working for writes.
+    """
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+    return ":".join([tool, os.path.realpath(file_path), str(mtime), *map(str, parts)])
+
+
 async def _get_client_and_params(
     file_path: str, needs_open: bool = True
 ) -> tuple[Any | None, str | None, str]:
@@ -403,6 +418,15 @@ async def lsp_document_symbols(file_path: str) -> str:
     # USER-VISIBLE NOTIFICATION
     print(f"📋 LSP-SYMBOLS: {file_path}", file=sys.stderr)
 
+    # Outlines from the language server are cached; empty answers, fallback
+    # and error output are not, so a server that is still indexing is asked again.
+    cache = IOCache.get_instance()
+    cache_key = _file_cache_key("lsp_document_symbols", file_path)
+    if cache_key:
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
+
     client, uri, lang = await _get_client_and_params(file_path)
 
     if client:
@@ -443,11 +467,14 @@ async def lsp_document_symbols(file_path: str) -> str:
                 process_symbols(response)
 
                 if lines:
-                    return (
+                    result = (
                         f"**Symbols in {Path(file_path).name}:**\n```\nLine | Kind Name\n"
                         + "\n".join(lines)
                         + "\n```"
                     )
+                    if cache_key:
+                        cache.set(cache_key, result)
+                    return result
 
             return "No symbols found"
 
@@ -0,0 +1,31 @@
+"""
+JSON encode/decode helpers backed by orjson when it is installed.
+
+orjson is an optional speed-up (``pip install stravinsky[perf]``). Without it
+the stdlib json module is used, so callers always get valid JSON text.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, 2-space indented when indent=True."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
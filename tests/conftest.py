@@ -3,6 +3,26 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to sys.path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture
+def isolated_agent_manager(tmp_path, monkeypatch):
+    """
+    Run agent tools from tmp_path with a fresh global AgentManager.
+
+    The manager keeps writing its state file from a writer thread and again at
+    exit, so it must never be rooted in the checkout's .stravinsky directory.
+    """
+    from mcp_bridge.tools import agent_manager
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(agent_manager, "_manager", None)
+    monkeypatch.setattr(agent_manager, "_token_store", None)
+    yield
+    if agent_manager._manager is not None:
+        agent_manager._manager.stop_all(clear_history=True)
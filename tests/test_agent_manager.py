@@ -35,6 +35,7 @@ from mcp_bridge.tools.agent_manager import (
     agent_retry,
     agent_spawn,
     get_manager,
+    _max_concurrent_agents,
 )
 
 
@@ -55,8 +56,10 @@ def temp_dir():
 async def agent_manager(temp_dir):
     """Create an AgentManager with a temporary directory."""
     manager = AgentManager(base_dir=temp_dir)
-    # Ensure global manager uses this instance during tests
-    with patch("mcp_bridge.tools.agent_manager._manager", manager):
+    # Ensure global manager uses this instance during tests, and that each test
+    # builds its own (possibly patched) TokenStore
+    with patch("mcp_bridge.tools.agent_manager._manager", manager), \
+         patch("mcp_bridge.tools.agent_manager._token_store", None):
         yield manager
         # Cleanup
         await manager.stop_all_async(clear_history=True)
@@ -206,6 +209,24 @@ class TestAgentManager:
         assert any(t["id"] == "task_1" for t in tasks)
         assert any(t["id"] == "task_2" for t in tasks)
 
+    @pytest.mark.asyncio
+    async def test_list_tasks_filters_by_parent_and_status(self, agent_manager):
+        """Test that list_tasks applies the parent session and status filters together."""
+        sid = agent_manager.session_id
+        agent_manager._save_tasks(
+            {
+                "a": {"id": "a", "status": "running", "parent_session_id": "p1", "terminal_session_id": sid},
+                "b": {"id": "b", "status": "completed", "parent_session_id": "p1", "terminal_session_id": sid},
+                "c": {"id": "c", "status": "running", "parent_session_id": "p2", "terminal_session_id": sid},
+            }
+        )
+
+        tasks = agent_manager.list_tasks(parent_session_id="p1", show_all=False)
+
+        assert [t["id"] for t in tasks] == ["a"]
+        tasks[0]["status"] = "changed"
+        assert agent_manager.get_task("a")["status"] == "running"
+
     @pytest.mark.asyncio
     async def test_update_task(self, agent_manager):
         """Test updating task fields."""
@@ -224,6 +245,57 @@ class TestAgentManager:
         assert updated["status"] == "completed"
         assert updated["result"] == "Success!"
 
+    @pytest.mark.asyncio
+    async def test_task_updates_reach_state_file(self, agent_manager):
+        """Test that task updates are written to the state file."""
+        agent_manager._save_tasks({"task_789": {"id": "task_789", "status": "pending"}})
+        agent_manager._update_task("task_789", status="running")
+        agent_manager._update_task("task_789", status="completed")
+
+        agent_manager.flush_tasks()
+
+        on_disk = json.loads(agent_manager.state_file.read_text())
+        assert on_disk["task_789"]["status"] == "completed"
+
+    def test_writer_thread_persists_updates(self, temp_dir):
+        """Test that updates are written by the writer thread without a flush."""
+        manager = AgentManager(base_dir=temp_dir)
+        manager._save_tasks({"task_1": {"id": "task_1", "status": "pending"}})
+        manager._update_task("task_1", status="completed")
+
+        deadline = time.monotonic() + 5
+        while json.loads(manager.state_file.read_text()).get("task_1", {}).get("status") != "completed":
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+    def test_processes_sharing_a_state_file_keep_each_others_tasks(self, temp_dir, monkeypatch):
+        """Test that managers writing one session's state file merge rather than overwrite."""
+        monkeypatch.setenv("CLAUDE_CODE_SESSION_ID", "shared_session")
+        first = AgentManager(base_dir=temp_dir)
+        second = AgentManager(base_dir=temp_dir)
+        assert first.state_file == second.state_file
+
+        first._save_tasks({"task_a": {"id": "task_a", "status": "running"}})
+        first.flush_tasks()
+        second._save_tasks({"task_b": {"id": "task_b", "status": "running"}})
+        second.flush_tasks()
+        first._update_task("task_a", status="completed")
+        first.flush_tasks()
+
+        on_disk = json.loads(first.state_file.read_text())
+        assert on_disk["task_a"]["status"] == "completed"
+        assert on_disk["task_b"]["status"] == "running"
+        assert first.get_task("task_b") is not None
+
+        tasks = second._load_tasks()
+        del tasks["task_b"]
+        second._save_tasks(tasks)
+        second.flush_tasks()
+
+        on_disk = json.loads(first.state_file.read_text())
+        assert set(on_disk) == {"task_a"}
+        assert on_disk["task_a"]["status"] == "completed"
+
     @pytest.mark.asyncio
     async def test_spawn_with_semantic_first(self, mock_subprocess, agent_manager, mock_token_store):
         """Test spawning a task with semantic_first enabled."""
@@ -278,6 +350,74 @@ class TestAgentManager:
             print(f"Task Failed Error: {task.get('error')}")
         assert task["status"] in ["pending", "running", "completed"]
 
+    def test_sync_spawn_runs_agent_to_completion(self, mock_subprocess, temp_dir, mock_token_store):
+        """Test that spawn() from sync code keeps the agent running after it returns."""
+        manager = AgentManager(base_dir=temp_dir)
+
+        task_id = manager.spawn(
+            token_store=mock_token_store,
+            prompt="Find authentication code",
+            agent_type="explore",
+            timeout=10,
+        )
+
+        deadline = time.monotonic() + 5
+        while manager.get_task(task_id)["status"] != "completed":
+            assert time.monotonic() < deadline, manager.get_task(task_id)
+            time.sleep(0.01)
+        assert manager.get_task(task_id)["result"] == "Agent output"
+
+    def test_system_prompt_files_are_shared(self, temp_dir):
+        """Test that agents with the same system prompt reuse one file."""
+        manager = AgentManager(base_dir=temp_dir)
+
+        first = manager._system_prompt_file("You are a explore specialist.")
+        second = manager._system_prompt_file("You are a explore specialist.")
+        other = manager._system_prompt_file("You are a dewey specialist.")
+
+        assert first == second != other
+        assert first.read_text() == "You are a explore specialist."
+
+    def test_system_prompt_file_is_never_seen_half_written(self, temp_dir, monkeypatch):
+        """Test that concurrent spawns with one prompt only ever read the whole file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_write_text(path, data, *args, **kwargs):
+            with open(path, "w") as f:
+                f.write(data[: len(data) // 2])
+                f.flush()
+                time.sleep(0.05)
+                f.write(data[len(data) // 2 :])
+
+        manager = AgentManager(base_dir=temp_dir)
+        monkeypatch.setattr(Path, "write_text", slow_write_text)
+        prompt = "You are a explore specialist."
+
+        def spawn_reads():
+            return manager._system_prompt_file(prompt).read_text() == prompt
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lambda _: spawn_reads(), range(16)))
+        assert not list(manager.agents_dir.glob("*.tmp"))
+
+    def test_sync_cleanup_prunes_unused_system_prompt_files(self, temp_dir):
+        """Test that prompt files idle past max age are removed and recently used ones kept."""
+        manager = AgentManager(base_dir=temp_dir)
+        stale = manager._system_prompt_file("You are a dewey specialist.")
+        reused = manager._system_prompt_file("You are a explore specialist.")
+        stray_tmp = manager.agents_dir / f"{stale.name}.123.456.tmp"
+        stray_tmp.write_text("half")
+        an_hour_ago = time.time() - 3600
+        for path in (stale, reused, stray_tmp):
+            os.utime(path, (an_hour_ago, an_hour_ago))
+
+        manager._system_prompt_file("You are a explore specialist.")
+        manager._sync_cleanup(max_age_minutes=30)
+
+        assert not stale.exists()
+        assert not stray_tmp.exists()
+        assert reused.read_text() == "You are a explore specialist."
+
     @pytest.mark.asyncio
     async def test_spawn_with_different_agent_types(self, mock_subprocess, agent_manager, mock_token_store):
         """Test spawning different agent types."""
@@ -374,6 +514,52 @@ class TestAgentManager:
         # Should contain output after blocking wait
         assert "Completed" in output
 
+    @pytest.mark.asyncio
+    async def test_blocking_get_output_wakes_on_completion(self, agent_manager):
+        """Test that a blocked get_output returns as soon as the task finishes."""
+        agent_manager._save_tasks({"task_1": {"id": "task_1", "status": "running"}})
+        waiting = asyncio.create_task(agent_manager.get_output("task_1", block=True, timeout=30))
+        await asyncio.sleep(0)
+
+        # Completion may be reported from another thread (the state is shared).
+        await asyncio.to_thread(
+            agent_manager._update_task, "task_1", status="completed", result="done"
+        )
+
+        output = await asyncio.wait_for(waiting, timeout=0.25)
+        assert "Completed" in output and "done" in output
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(None, 16), ("4", 4), ("lots", 16), ("", 16), ("0", 1), ("-3", 1)],
+    )
+    def test_max_concurrent_agents_from_environment(self, monkeypatch, value, expected):
+        """Test that invalid or non-positive STRAVINSKY_MAX_AGENTS values fall back safely."""
+        if value is None:
+            monkeypatch.delenv("STRAVINSKY_MAX_AGENTS", raising=False)
+        else:
+            monkeypatch.setenv("STRAVINSKY_MAX_AGENTS", value)
+
+        assert _max_concurrent_agents() == expected
+
+    @pytest.mark.asyncio
+    async def test_spawn_waits_for_a_free_run_slot(self, mock_subprocess, agent_manager, mock_token_store):
+        """Test that agents beyond MAX_CONCURRENT_AGENTS stay pending until a slot frees."""
+        agent_manager.MAX_CONCURRENT_AGENTS = 1
+        await agent_manager._acquire_run_slot()
+
+        task_id = await agent_manager.spawn_async(
+            token_store=mock_token_store, prompt="Queued", agent_type="explore", timeout=10
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert agent_manager.get_task(task_id)["status"] == "pending"
+
+        agent_manager._release_run_slot()
+        output = await agent_manager.get_output(task_id, block=True, timeout=5)
+        assert "Completed" in output
+        assert agent_manager._running_agents == 0
+
     @pytest.mark.asyncio
     async def test_get_output_nonexistent_task(self, agent_manager):
         """Test getting output from a task that does not exist."""
@@ -451,6 +637,54 @@ class TestAgentManager:
         progress = agent_manager.get_progress(task_id, lines=10)
         assert "Agent Progress" in progress
 
+    @pytest.mark.asyncio
+    async def test_get_progress_shows_output_while_running(
+        self, mock_subprocess, agent_manager, mock_token_store
+    ):
+        """Test that stdout reaches the progress output before the agent exits."""
+        _, mock_process = mock_subprocess
+        release = asyncio.Event()
+        lines = iter([b"step 1\n"])
+
+        async def readline():
+            line = next(lines, None)
+            if line is not None:
+                return line
+            await release.wait()
+            return b""
+
+        mock_process.stdout.readline = AsyncMock(side_effect=readline)
+        mock_process.wait = AsyncMock(side_effect=release.wait)
+
+        task_id = await agent_manager.spawn_async(
+            token_store=mock_token_store,
+            prompt="Task with progress",
+            agent_type="explore",
+            timeout=30,
+        )
+        for _ in range(50):
+            await asyncio.sleep(0)
+            if "step 1" in agent_manager.get_progress(task_id):
+                break
+
+        assert "step 1" in agent_manager.get_progress(task_id)
+        assert agent_manager.get_task(task_id)["status"] == "running"
+        # Running agents are served from memory, not the .out file.
+        (agent_manager.agents_dir / f"{task_id}.out").unlink()
+        assert "step 1" in agent_manager.get_progress(task_id)
+        release.set()
+
+    def test_tail_lines_reads_only_the_end(self, tmp_path):
+        """Test that _tail_lines matches a full read for the last lines of a file."""
+        from mcp_bridge.tools.agent_manager import _tail_lines
+
+        output_file = tmp_path / "task.out"
+        text = "\n".join(f"line {i}" for i in range(5000)) + "\n\n"
+        output_file.write_text(text)
+
+        assert _tail_lines(output_file, 20, chunk_size=64) == text.strip().split("\n")[-20:]
+        assert _tail_lines(output_file, 3) == ["line 4997", "line 4998", "line 4999"]
+
     @pytest.mark.asyncio
     async def test_get_progress_nonexistent_task(self, agent_manager):
         """Test getting progress for a nonexistent task."""
@@ -570,6 +804,15 @@ class TestAgentSpawn:
 
         assert "agent_" in result
 
+    @pytest.mark.asyncio
+    @patch("mcp_bridge.auth.token_store.TokenStore")
+    async def test_agent_spawn_reuses_token_store(self, mock_token_store_class, mock_subprocess, agent_manager):
+        """Test that repeated spawns share one TokenStore."""
+        for _ in range(3):
+            await agent_spawn(prompt="Find config", agent_type="explore", timeout=10)
+
+        mock_token_store_class.assert_called_once()
+
     @pytest.mark.asyncio
     @patch("mcp_bridge.auth.token_store.TokenStore")
     async def test_agent_spawn_blocking_mode(self, mock_token_store_class, mock_subprocess, agent_manager):
@@ -116,6 +116,18 @@ def test_ansi_colors_present():
     assert '\x1b[' in output, "Output should contain ANSI color codes"
 
 
+def test_no_color_output_is_plain(monkeypatch):
+    """Test that NO_COLOR output matches the colored text without ANSI codes."""
+    from mcp_bridge.tools import agent_manager
+
+    colored = format_spawn_output("explore", "gemini-3-flash", "task_abc123", OutputMode.CLEAN)
+    monkeypatch.setattr(agent_manager, "_USE_COLOR", False)
+    plain = format_spawn_output("explore", "gemini-3-flash", "task_abc123", OutputMode.CLEAN)
+
+    assert '\x1b[' not in plain
+    assert plain == re.sub(r'\x1b\[[0-9;]*m', '', colored)
+
+
 def test_format_consistency():
     """Test format is consistent across multiple calls."""
     outputs = [
@@ -11,6 +11,9 @@ Tests cover:
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+# Agents write state under cwd/.stravinsky: keep it out of the checkout.
+pytestmark = pytest.mark.usefixtures("isolated_agent_manager")
+
 
 # ============================================================================
 # FIXTURES
@@ -4,6 +4,9 @@ import time
 from mcp_bridge.tools.agent_manager import agent_spawn
 from unittest.mock import patch, AsyncMock
 
+# Agents write state under cwd/.stravinsky: keep it out of the checkout.
+pytestmark = pytest.mark.usefixtures("isolated_agent_manager")
+
 @pytest.mark.asyncio
 async def test_event_loop_not_blocked_by_spawn():
     """Verify that spawning an agent does not block the event loop for more than 50ms."""
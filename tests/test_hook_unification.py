@@ -67,3 +67,16 @@ async def test_tool_call_event_from_mcp():
 
     event_pre = ToolCallEvent.from_mcp("TestTool", {"a": 1})
     assert event_pre.event_type == EventType.PRE_TOOL_CALL
+
+
+def test_hook_manager_reports_registered_tool_hooks():
+    from mcp_bridge.hooks.manager import HookManager
+
+    manager = HookManager()
+    assert not manager.has_pre_tool_call_hooks()
+    assert not manager.has_post_tool_call_hooks()
+
+    manager.register_policy(MockPolicy())
+
+    assert not manager.has_pre_tool_call_hooks()
+    assert manager.has_post_tool_call_hooks()
@@ -19,6 +19,7 @@ All tests use mocks to avoid real LSP server calls.
 """
 
 import asyncio
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -282,6 +283,36 @@ async def test_lsp_document_symbols_no_symbols(temp_python_file, mock_lsp_manage
     assert "No symbols found" in result
 
 
+@pytest.mark.asyncio
+async def test_lsp_document_symbols_cached_until_file_changes(temp_python_file, mock_lsp_manager, mock_lsp_client):
+    """Test repeated lsp_document_symbols calls reuse the outline until the file is modified."""
+    symbol = MagicMock()
+    symbol.name = "calculate_sum"
+    symbol.kind = 12
+    symbol.range.start.line = 2
+    symbol.children = []
+    mock_lsp_client.protocol.send_request_async.return_value = [symbol]
+
+    await tools.lsp_document_symbols(str(temp_python_file))
+    await tools.lsp_document_symbols(str(temp_python_file))
+    assert mock_lsp_client.protocol.send_request_async.call_count == 1
+
+    stat = temp_python_file.stat()
+    os.utime(temp_python_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    await tools.lsp_document_symbols(str(temp_python_file))
+    assert mock_lsp_client.protocol.send_request_async.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lsp_document_symbols_does_not_cache_empty_answer(temp_python_file, mock_lsp_manager, mock_lsp_client):
+    """Test an empty outline is asked for again, e.g. while the server is still indexing."""
+    mock_lsp_client.protocol.send_request_async.return_value = []
+
+    await tools.lsp_document_symbols(str(temp_python_file))
+    await tools.lsp_document_symbols(str(temp_python_file))
+    assert mock_lsp_client.protocol.send_request_async.call_count == 2
+
+
 # ============================================================================
 # TEST: lsp_workspace_symbols
 # ============================================================================
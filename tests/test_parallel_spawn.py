@@ -4,6 +4,9 @@ import time
 from unittest.mock import MagicMock, patch, AsyncMock
 from mcp_bridge.tools.agent_manager import get_manager
 
+# Agents write state under cwd/.stravinsky: keep it out of the checkout.
+pytestmark = pytest.mark.usefixtures("isolated_agent_manager")
+
 @pytest.mark.asyncio
 async def test_parallel_agent_spawn():
     """Verify that multiple agents can be spawned in parallel without blocking."""
@@ -0,0 +1,255 @@
+"""Tests for call_tool dispatch and batch_execute in mcp_bridge.server."""
+
+import asyncio
+import json
+
+import pytest
+
+from mcp_bridge import server
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_reports_name():
+    result = await server.call_tool("no_such_tool", {})
+    assert result[0].text == "Unknown tool: no_such_tool"
+
+
+@pytest.mark.asyncio
+async def test_generated_handler_forwards_arguments(tmp_path):
+    (tmp_path / "hello.txt").write_text("hi")
+
+    result = await server.call_tool("list_directory", {"path": str(tmp_path)})
+
+    assert "[FILE] hello.txt" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_returns_results_in_call_order(tmp_path):
+    (tmp_path / "a.txt").write_text("alpha")
+    (tmp_path / "b.txt").write_text("beta")
+
+    result = await server.call_tool(
+        "batch_execute",
+        {
+            "calls": [
+                {"name": "read_file", "arguments": {"path": str(tmp_path / "a.txt")}},
+                {"name": "read_file", "arguments": {"path": str(tmp_path / "b.txt")}},
+            ]
+        },
+    )
+    entries = json.loads(result[0].text)
+
+    assert [e["ok"] for e in entries] == [True, True]
+    assert "alpha" in entries[0]["result"]
+    assert "beta" in entries[1]["result"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_reports_failures_per_call(tmp_path):
+    result = await server.call_tool(
+        "batch_execute",
+        {
+            "calls": [
+                {"name": "no_such_tool"},
+                {"name": "list_directory", "arguments": {"path": str(tmp_path)}},
+            ]
+        },
+    )
+    entries = json.loads(result[0].text)
+
+    assert entries[0]["ok"] is False
+    assert "Unknown tool" in entries[0]["error"]
+    assert entries[1]["ok"] is True
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_rejects_nesting():
+    result = await server.call_tool(
+        "batch_execute", {"calls": [{"name": "batch_execute", "arguments": {"calls": []}}]}
+    )
+    entries = json.loads(result[0].text)
+
+    assert entries[0]["ok"] is False
+    assert "nested" in entries[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_validates_each_call():
+    result = await server.call_tool("batch_execute", {"calls": [{"name": "read_file"}]})
+    entries = json.loads(result[0].text)
+
+    assert entries[0]["ok"] is False
+    assert "Input validation error: 'path' is a required property" in entries[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_truncates_per_call_and_stays_valid_json(monkeypatch):
+    from mcp_bridge.hooks.manager import HookManager
+    from mcp_bridge.hooks.truncation_policy import TruncationPolicy
+
+    async def handler(arguments):
+        return arguments["fill"] * 15000
+
+    manager = HookManager()
+    manager.register_policy(TruncationPolicy())
+    monkeypatch.setattr(server, "_hook_manager", manager)
+    monkeypatch.setitem(server._TOOL_HANDLERS, "big_tool", handler)
+
+    result = await server.call_tool(
+        "batch_execute",
+        {
+            "calls": [
+                {"name": "big_tool", "arguments": {"fill": "ab"}},
+                {"name": "big_tool", "arguments": {"fill": "cd"}},
+            ]
+        },
+    )
+    entries = json.loads(result[0].text)
+
+    assert [e["ok"] for e in entries] == [True, True]
+    for entry in entries:
+        assert "truncated" in entry["result"]
+        assert len(entry["result"]) < 25000
+
+
+@pytest.mark.asyncio
+async def test_generated_handler_reports_missing_required_argument():
+    result = await server.call_tool("read_file", {})
+
+    assert "read_file: missing required argument 'path'" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_structured_results_are_returned_as_json(monkeypatch):
+    async def handler(arguments):
+        return {"tasks": [{"id": "t1", "done": True}]}
+
+    monkeypatch.setitem(server._TOOL_HANDLERS, "structured_tool", handler)
+
+    result = await server.call_tool("structured_tool", {})
+
+    assert json.loads(result[0].text) == {"tasks": [{"id": "t1", "done": True}]}
+
+
+@pytest.mark.asyncio
+async def test_post_hooks_see_string_results_as_text(monkeypatch):
+    from mcp_bridge.hooks.manager import HookManager
+
+    async def handler(arguments):
+        return "raw output"
+
+    async def shout(tool_name, arguments, output):
+        return output.upper()
+
+    manager = HookManager()
+    manager.register_post_tool_call(shout)
+    monkeypatch.setattr(server, "_hook_manager", manager)
+    monkeypatch.setitem(server._TOOL_HANDLERS, "string_tool", handler)
+
+    result = await server.call_tool("string_tool", {})
+
+    assert [c.text for c in result] == ["RAW OUTPUT"]
+
+
+@pytest.mark.asyncio
+async def test_tool_errors_are_summarized_for_the_client(monkeypatch):
+    async def handler(arguments):
+        raise RuntimeError("x" * 5000)
+
+    monkeypatch.setitem(server._TOOL_HANDLERS, "failing_tool", handler)
+
+    result = await server.call_tool("failing_tool", {})
+
+    assert result[0].text.startswith("Error: RuntimeError: xxx")
+    assert "Traceback" not in result[0].text
+    assert len(result[0].text) <= len("Error: ") + server._MAX_ERROR_CHARS
+
+
+@pytest.mark.asyncio
+async def test_client_calls_are_validated_against_input_schema():
+    from mcp.types import CallToolRequest, CallToolRequestParams
+
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name="read_file", arguments={})
+    )
+
+    result = (await handler(request)).root
+
+    assert result.isError is True
+    assert result.content[0].text == "Input validation error: 'path' is a required property"
+
+
+@pytest.mark.asyncio
+async def test_system_restart_flushes_agent_state_before_exit(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from mcp_bridge.tools import agent_manager
+
+    exited = asyncio.Event()
+    manager = MagicMock()
+    monkeypatch.setattr(agent_manager, "_manager", manager)
+    monkeypatch.setattr(server, "_stdout_writer", None)
+    monkeypatch.setattr(server.os, "_exit", lambda code: exited.set())
+
+    await server.call_tool("system_restart", {})
+    await asyncio.wait_for(exited.wait(), timeout=1)
+
+    manager.flush_tasks.assert_called_once()
+
+
+class _RecordingFile:
+    def __init__(self):
+        self.lines = []
+
+    async def write(self, data):
+        self.lines.append(data)
+        return len(data)
+
+    async def flush(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_stdout_writer_signals_only_the_awaited_response():
+    writer = server._FlushSignalingWriter(_RecordingFile())
+    replied = writer.response_flushed(7)
+
+    # Messages flushed before the reply, including a server request reusing id 7
+    for message in (
+        '{"jsonrpc":"2.0","method":"notifications/progress","params":{}}',
+        '{"jsonrpc":"2.0","id":3,"result":{}}',
+        '{"jsonrpc":"2.0","id":7,"method":"ping"}',
+    ):
+        await writer.write(message + "\n")
+        await writer.flush()
+        assert not replied.is_set()
+
+    await writer.write('{"jsonrpc":"2.0","id":7,"result":{}}\n')
+    assert not replied.is_set()
+    await writer.flush()
+    assert replied.is_set()
+
+
+@pytest.mark.asyncio
+async def test_system_restart_waits_for_its_own_reply(monkeypatch):
+    from types import SimpleNamespace
+
+    writer = server._FlushSignalingWriter(_RecordingFile())
+    exited = asyncio.Event()
+    monkeypatch.setattr(server, "_stdout_writer", writer)
+    monkeypatch.setattr(server.os, "_exit", lambda code: exited.set())
+    monkeypatch.setattr(
+        type(server.server), "request_context", property(lambda self: SimpleNamespace(request_id=5))
+    )
+
+    await server.call_tool("system_restart", {})
+    # A notification flushed ahead of the reply must not trigger the exit
+    await writer.write('{"jsonrpc":"2.0","method":"notifications/message","params":{}}\n')
+    await writer.flush()
+    await asyncio.sleep(0.05)
+    assert not exited.is_set()
+
+    await writer.write('{"jsonrpc":"2.0","id":5,"result":{}}\n')
+    await writer.flush()
+    await asyncio.wait_for(exited.wait(), timeout=1)
@@ -0,0 +1,69 @@
+"""Tests for the static tool and prompt catalogs in mcp_bridge.server_tools."""
+
+from mcp.types import Prompt, Tool
+
+from mcp_bridge import server_tools
+
+
+def test_tool_definitions_pass_full_validation():
+    # The catalog is built with model_construct, so check here that every
+    # definition would also survive Tool(...) validation.
+    tools = server_tools.get_tool_definitions()
+
+    for tool in tools:
+        Tool.model_validate(tool.model_dump(by_alias=True))
+    assert len({tool.name for tool in tools}) == len(tools)
+
+
+def test_prompt_definitions_pass_full_validation():
+    for prompt in server_tools.get_prompt_definitions():
+        Prompt.model_validate(prompt.model_dump(by_alias=True))
+
+
+def test_tool_meta_is_sent_under_the_meta_key():
+    from mcp.types import ListToolsResult, ServerResult
+
+    result = ServerResult(ListToolsResult(tools=list(server_tools.get_tool_definitions())))
+    tools = result.model_dump(mode="json", by_alias=True, exclude_none=True)["tools"]
+    hover = next(tool for tool in tools if tool["name"] == "lsp_hover")
+
+    assert hover["meta"] == {"defer_loading": True}
+    assert "_meta" not in hover
+
+
+def test_definitions_are_built_once():
+    assert server_tools.get_tool_definitions() is server_tools.get_tool_definitions()
+    assert server_tools.get_prompt_definitions() is server_tools.get_prompt_definitions()
+    assert isinstance(server_tools.get_prompt_definitions(), tuple)
+
+
+def test_get_tool_looks_up_definitions_by_name():
+    tool = server_tools.get_tool("lsp_hover")
+
+    assert tool is not None and tool.name == "lsp_hover"
+    assert tool in server_tools.get_tool_definitions()
+    assert server_tools.get_tool("no_such_tool") is None
+
+
+def test_validate_tool_arguments_reports_schema_violations():
+    assert server_tools.validate_tool_arguments("read_file", {"path": "x"}) is None
+    assert (
+        server_tools.validate_tool_arguments("read_file", {})
+        == "'path' is a required property"
+    )
+    assert "is not of type 'integer'" in server_tools.validate_tool_arguments(
+        "lsp_hover", {"file_path": "a.py", "line": "1", "character": 0}
+    )
+
+
+def test_validate_tool_arguments_compiles_each_schema_once():
+    server_tools.validate_tool_arguments("lsp_hover", {})
+    validator = server_tools._validators["lsp_hover"]
+
+    server_tools.validate_tool_arguments("lsp_hover", {"file_path": "a.py"})
+
+    assert server_tools._validators["lsp_hover"] is validator
+
+
+def test_validate_tool_arguments_ignores_unknown_tools():
+    assert server_tools.validate_tool_arguments("no_such_tool", {"x": 1}) is None